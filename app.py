@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
+from tkinter import font as tkfont
 import os
 import sys
 import platform
@@ -10,9 +11,20 @@ from pathlib import Path
 import importlib.util
 import warnings
 import re
-from difflib import get_close_matches, SequenceMatcher
+import math
+import csv
+import shutil
+from difflib import SequenceMatcher, get_close_matches
+try:
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
 import threading
-import odf
+import queue
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
 from functools import lru_cache
 import json
 import urllib.request
@@ -43,6 +55,11 @@ DEFAULT_FONT_SIZES = {
     "tiny": 8
 }
 
+# Grid sticky specs shared by the tab builders
+NSEW = (tk.W, tk.E, tk.N, tk.S)
+WE = (tk.W, tk.E)
+NS = (tk.N, tk.S)
+
 # Colors
 COLORS = {
     "success": "green",
@@ -59,6 +76,18 @@ LOG_LEVELS = {
     "DEBUG": "DEBUG"
 }
 
+# Log widgets keep at most this many lines
+LOG_MAX_LINES = 5000
+# Per-row match details are handed to the log this many lines at a time
+LOG_BATCH_LINES = 1000
+
+# Candidate lists kept per length window by windowed_choices (LRU)
+WINDOW_CACHE_SIZE = 64
+
+# Distinct fuzzy lookups below this count are scored in-process; above it
+# they are spread over a process pool (see _prefill_match_cache)
+PARALLEL_MATCH_MIN = 2000
+
 # File paths and directories
 TEMP_DIR_NAME = "temp_excel_files"
 ENTERPRISE_NAME = "your company name"
@@ -73,12 +102,15 @@ EXCEL_SIGNATURES = {
     "xls": b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1'  # XLS files
 }
 
-# Common delimiters for multi-value processing
+# Common delimiters for multi-value processing, in order of precedence
 COMMON_DELIMITERS = [',', ';', '|']
 
 # Column name keywords for auto-detection
 NAME_KEYWORDS = ['name', 'naam', 'full name', 'fullname', 'participant']
 ID_KEYWORDS = ['id', 'signum', 'employee id', 'emp id', 'userid', 'user id']
+# Substring match against any keyword, in one regex search per column name
+NAME_KEYWORDS_RE = re.compile("|".join(map(re.escape, NAME_KEYWORDS)))
+ID_KEYWORDS_RE = re.compile("|".join(map(re.escape, ID_KEYWORDS)))
 
 # GitHub API configuration
 GITHUB_API_URL = "https://api.github.com/repos/frenzywall/Excella-Prod/releases/latest"
@@ -87,6 +119,10 @@ USER_AGENT = "Excella-Update-Checker/1.0"
 # Core packages for frozen executable detection
 CORE_PACKAGES = ["pandas", "openpyxl", "xlrd", "packaging"]
 
+# Running as a PyInstaller executable; fixed for the life of the process
+_FROZEN = bool(getattr(sys, 'frozen', False))
+_FROZEN_CORE = frozenset(CORE_PACKAGES)
+
 # ============================================================================
 # DEPENDENCY CONFIGURATION
 # ============================================================================
@@ -96,10 +132,13 @@ DEPENDENCY_VERSIONS = {
     "openpyxl": ">=3.1.4",
     "xlrd": ">=2.0.1",
     "pyxlsb": ">=1.0.9",
+    "python-calamine": ">=0.2.0",
     "fuzzywuzzy": ">=0.18.0",
     "python-Levenshtein": ">=0.12.2",
+    "rapidfuzz": ">=3.0.0",
     "XlsxWriter": ">=3.2.0",
     "pyarrow": ">=16.1.0",
+    "charset-normalizer": ">=3.0.0",
     "pywin32": ">=310",
     "packaging": ">=23.2",  # <-- Added packaging
 }
@@ -111,10 +150,13 @@ DEPENDENCY_INFO = [
     {"name": "xlrd", "import": "xlrd", "required": True, "desc": "Read legacy .xls files", "version": DEPENDENCY_VERSIONS["xlrd"]},
     {"name": "packaging", "import": "packaging", "required": True, "desc": "Version parsing and comparison", "version": DEPENDENCY_VERSIONS["packaging"]},  # <-- Added packaging
     {"name": "pyxlsb", "import": "pyxlsb", "required": False, "desc": "Read .xlsb files (optional)", "version": DEPENDENCY_VERSIONS["pyxlsb"]},
+    {"name": "python-calamine", "import": "python_calamine", "required": False, "desc": "Fast native Excel reader (optional)", "version": DEPENDENCY_VERSIONS["python-calamine"]},
     {"name": "fuzzywuzzy", "import": "fuzzywuzzy", "required": False, "desc": "Fuzzy string matching (optional)", "version": DEPENDENCY_VERSIONS["fuzzywuzzy"]},
     {"name": "python-Levenshtein", "import": "Levenshtein", "required": False, "desc": "Faster fuzzywuzzy (optional)", "version": DEPENDENCY_VERSIONS["python-Levenshtein"]},
+    {"name": "rapidfuzz", "import": "rapidfuzz", "required": False, "desc": "Fast fuzzy name matching (optional)", "version": DEPENDENCY_VERSIONS["rapidfuzz"]},
     {"name": "XlsxWriter", "import": "xlsxwriter", "required": False, "desc": "Alternative Excel writer (optional)", "version": DEPENDENCY_VERSIONS["XlsxWriter"]},
     {"name": "pyarrow", "import": "pyarrow", "required": False, "desc": "Faster data operations (optional)", "version": DEPENDENCY_VERSIONS["pyarrow"]},
+    {"name": "charset-normalizer", "import": "charset_normalizer", "required": False, "desc": "CSV encoding detection (optional)", "version": DEPENDENCY_VERSIONS["charset-normalizer"]},
     {"name": "pywin32", "import": "win32api", "required": False, "desc": "Enterprise Excel/COM support (Windows only, optional)", "version": DEPENDENCY_VERSIONS["pywin32"]},
 ]
 
@@ -127,59 +169,293 @@ HAS_PYXLSB = False
 HAS_OPENPYXL = False
 HAS_XLRD = False
 HAS_PACKAGING = False  # <-- Added packaging flag
+HAS_CALAMINE = False
+HAS_PYARROW = False
+HAS_CHARSET_NORMALIZER = False
+HAS_XLSXWRITER = False
+
+# (flag name, module) pairs probed at startup. find_spec only checks that a
+# module can be found, so nothing heavy is imported until it is actually used.
+_PROBES = [
+    ("HAS_PANDAS", "pandas"),
+    ("HAS_WIN32COM", "win32com.client"),
+    ("HAS_PYTHONCOM", "pythoncom"),
+    ("HAS_ODF", "odf"),
+    ("HAS_PYXLSB", "pyxlsb"),
+    ("HAS_OPENPYXL", "openpyxl"),
+    ("HAS_XLRD", "xlrd"),
+    ("HAS_PACKAGING", "packaging"),
+    ("HAS_CALAMINE", "python_calamine"),
+    ("HAS_PYARROW", "pyarrow"),
+    ("HAS_CHARSET_NORMALIZER", "charset_normalizer"),
+    ("HAS_XLSXWRITER", "xlsxwriter"),
+]
 
-# Dependency details for UI
+def _module_available(module_name):
+    try:
+        return importlib.util.find_spec(module_name.split('.')[0]) is not None
+    except (ImportError, ValueError):
+        return False
 
-# Try to import dependencies and set flags
-try:
-    import pandas as pd
-    HAS_PANDAS = True
-except ImportError:
-    pass
-try:
-    import win32com.client
-    HAS_WIN32COM = True
-except ImportError:
-    pass
-try:
-    import pythoncom
-    HAS_PYTHONCOM = True
-except ImportError:
-    pass
-try:
-    import odf
-    HAS_ODF = True
-except ImportError:
-    pass
-try:
-    import pyxlsb
-    HAS_PYXLSB = True
-except ImportError:
-    pass
-try:
-    import openpyxl
-    HAS_OPENPYXL = True
-except ImportError:
-    pass
-try:
-    import xlrd
-    HAS_XLRD = True
-except ImportError:
-    pass
-try:
-    import packaging
-    HAS_PACKAGING = True
-except ImportError:
-    pass
+def _module_importable(module_name):
+    try:
+        importlib.import_module(module_name)
+        return True
+    except ImportError:
+        return False
+
+for _flag, _module in _PROBES:
+    globals()[_flag] = _module_available(_module)
 
 # When running as a compiled executable, we need to force these flags to True
 # since the imports work differently in frozen environments
-if getattr(sys, 'frozen', False):
+if _FROZEN:
     HAS_PANDAS = True
     HAS_OPENPYXL = True
     HAS_XLRD = True
     HAS_PACKAGING = True
 
+# Heavy modules are imported on first use rather than at startup. The
+# optional readers return None when the package is missing.
+@lru_cache(maxsize=None)
+def _pd():
+    import pandas as pd
+    return pd
+
+@lru_cache(maxsize=None)
+def _openpyxl():
+    import openpyxl
+    return openpyxl
+
+@lru_cache(maxsize=None)
+def _xlrd():
+    import xlrd
+    return xlrd
+
+@lru_cache(maxsize=None)
+def _pyxlsb():
+    try:
+        import pyxlsb
+    except ImportError:
+        return None
+    return pyxlsb
+
+@lru_cache(maxsize=None)
+def _np():
+    import numpy
+    return numpy
+
+@lru_cache(maxsize=None)
+def _odf():
+    try:
+        import odf
+    except ImportError:
+        return None
+    return odf
+
+@lru_cache(maxsize=None)
+def _calamine():
+    try:
+        import python_calamine
+    except ImportError:
+        return None
+    return python_calamine
+
+@lru_cache(maxsize=None)
+def _pyarrow_csv():
+    try:
+        import pyarrow.csv
+    except ImportError:
+        return None
+    return pyarrow.csv
+
+@lru_cache(maxsize=None)
+def _charset_normalizer():
+    try:
+        import charset_normalizer
+    except ImportError:
+        return None
+    return charset_normalizer
+
+# pandas read_excel engine -> accessor for the module backing it
+_ENGINE_MODULES = {
+    "calamine": _calamine,
+    "openpyxl": _openpyxl,
+    "xlrd": _xlrd,
+    "pyxlsb": _pyxlsb,
+    "odf": _odf,
+}
+
+if HAS_PACKAGING:
+    from packaging import version as packaging_version
+
+# Cell dtype for loaded sheets: every cell is read as text to preserve formats,
+# stored in Arrow string columns when pyarrow is available
+TEXT_DTYPE = "string[pyarrow]" if HAS_PYARROW else str
+
+# Name normalisation patterns, compiled once for clean_name_series
+_WHITESPACE_RE = re.compile(r'\s+')
+_NAME_STRIP_RE = re.compile(r'[^\w\s\-]')
+
+# Fuzzy matching: RapidFuzz when installed, difflib otherwise
+if HAS_RAPIDFUZZ:
+    def closest_match(query, choices, cutoff):
+        """Closest choice to query as (choice, similarity 0-1), or None below cutoff"""
+        # fuzz.ratio is the normalized Indel similarity, scored in C++. It is close to,
+        # but not the same as, difflib's Ratcliff/Obershelp ratio, and ties go to the
+        # first choice rather than the greatest string, so picks can differ slightly
+        result = rf_process.extractOne(query, choices, scorer=rf_fuzz.ratio, score_cutoff=cutoff * 100)
+        if result is None:
+            return None
+        return result[0], result[1] / 100.0
+
+    def closest_matches(queries, choices, cutoff):
+        """closest_match for many queries, scored as blocks of one multi-threaded cdist matrix"""
+        if not choices:
+            return [None] * len(queries)
+        np = _np()
+        # Keep each float64 score block around 32 MiB
+        block_rows = max(1, (32 << 20) // (8 * len(choices)))
+        score_cutoff = cutoff * 100
+        results = []
+        for start in range(0, len(queries), block_rows):
+            scores = rf_process.cdist(
+                queries[start:start + block_rows], choices, scorer=rf_fuzz.ratio,
+                score_cutoff=score_cutoff, dtype=np.float64, workers=-1
+            )
+            # argmax takes the first of equal scores, as extractOne does
+            best = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(best)), best]
+            results.extend(
+                (choices[j], score / 100.0) if score >= score_cutoff else None
+                for j, score in zip(best.tolist(), best_scores.tolist())
+            )
+        return results
+else:
+    def closest_match(query, choices, cutoff):
+        """Closest choice to query as (choice, similarity 0-1), or None below cutoff"""
+        matches = get_close_matches(query, choices, n=1, cutoff=cutoff)
+        if not matches:
+            return None
+        return matches[0], SequenceMatcher(None, query, matches[0]).ratio()
+
+    closest_matches = None
+
+def windowed_choices(choices, query, cutoff, cache):
+    """The choices whose length lets them reach cutoff against query, in their original order.
+    
+    Both fuzz.ratio and SequenceMatcher.ratio are 2*M/(a+b) with M <= min(a, b),
+    so a choice of length b can only score >= cutoff if b lies within
+    [a*c/(2-c), a*(2-c)/c]. Subsets are memoized in cache, an OrderedDict used
+    as an LRU keyed by the (rounded outward) window.
+    """
+    if cutoff <= 0:
+        return choices
+    query_len = len(query)
+    window = (math.floor(query_len * cutoff / (2 - cutoff)), math.ceil(query_len * (2 - cutoff) / cutoff))
+    subset = cache.get(window)
+    if subset is None:
+        low, high = window
+        subset = [choice for choice in choices if low <= len(choice) <= high]
+        cache[window] = subset
+        if len(cache) > WINDOW_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(window)
+    return subset
+
+# Per-process state for fuzzy-matching pool workers, set by _init_match_worker
+_worker_choices = None
+_worker_cutoff = None
+_worker_windows = None
+
+def _init_match_worker(choices, cutoff):
+    """Receive the master names once per worker process instead of once per task"""
+    global _worker_choices, _worker_cutoff, _worker_windows
+    _worker_choices = choices
+    _worker_cutoff = cutoff
+    _worker_windows = OrderedDict()
+
+def _match_worker(queries):
+    """closest_match for a chunk of queries inside a pool worker"""
+    return [
+        closest_match(query, windowed_choices(_worker_choices, query, _worker_cutoff, _worker_windows), _worker_cutoff)
+        for query in queries
+    ]
+
+def clean_name_series(series):
+    """Clean and normalize names for comparison, with pandas' vectorized string methods"""
+    pd = _pd()
+    if isinstance(series.dtype, pd.StringDtype):
+        # Missing cells become 'nan' under astype(str) for object columns; keep that for
+        # Arrow string columns instead of '<NA>', which would clean to 'na' and match 'N/A'
+        series = series.fillna("nan")
+    text = series.astype(str)
+    # Names repeat heavily in real sheets: run the regex passes over distinct values only
+    codes, uniques = pd.factorize(text)
+    # Collapse whitespace and lowercase, then drop special characters except spaces and hyphens
+    cleaned = (
+        pd.Series(uniques, dtype=text.dtype)
+        .str.strip()
+        .str.replace(_WHITESPACE_RE, ' ', regex=True)
+        .str.lower()
+        .str.replace(_NAME_STRIP_RE, '', regex=True)
+        .str.strip()  # Additional strip after cleaning
+    )
+    return cleaned.take(codes).set_axis(series.index).rename(series.name)
+
+def split_multivalue_cells(texts, delimiters, mask):
+    """Explode the cells selected by mask into one row per non-empty token.
+    
+    Returns a DataFrame indexed by row position with each token's delimiter,
+    its stripped text and cleaned name, in cell order. Cells that yield fewer
+    than two tokens are left out; they are matched as single values.
+    """
+    pd = _pd()
+    np = _np()
+    positions = np.flatnonzero(mask)
+    cells = pd.DataFrame({'text': texts[positions], 'delimiter': delimiters[positions]}, index=positions)
+    parts = []
+    for delim in COMMON_DELIMITERS:
+        group = cells.loc[cells['delimiter'] == delim, 'text']
+        if not group.empty:
+            tokens = group.str.split(delim, regex=False).explode().str.strip()
+            parts.append(pd.DataFrame({'delimiter': delim, 'token': tokens}))
+    tokens = pd.concat(parts).sort_index(kind='stable')
+    tokens = tokens[tokens['token'] != ""]
+    tokens = tokens[tokens.groupby(level=0)['token'].transform('size') > 1]
+    return tokens.assign(clean=clean_name_series(tokens['token']))
+
+def excel_column_widths(df, max_width=50):
+    """Column widths for an Excel export: the longest header or value plus padding, capped at max_width"""
+    widths = []
+    for col in df.columns:
+        lengths = df[col].dropna().astype(str).str.len()
+        longest = max(len(str(col)), int(lengths.max()) if not lengths.empty else 0)
+        widths.append(min(longest + 2, max_width))
+    return widths
+
+@lru_cache(maxsize=None)
+def _drive_is_local(drive):
+    """Whether a Windows drive letter is a local disk rather than a network share"""
+    import ctypes
+    # DRIVE_REMOTE (4) and DRIVE_NO_ROOT_DIR (1) are the only non-local answers we care about
+    return ctypes.windll.kernel32.GetDriveTypeW(f"{drive}\\") not in (1, 4)
+
+def _is_remote_path(filepath):
+    """Whether filepath lives on OneDrive/SharePoint or a network share"""
+    lowered = filepath.lower()
+    if 'onedrive' in lowered or 'sharepoint' in lowered or filepath.startswith(('\\\\', '//')):
+        return True
+    if platform.system() == 'Windows':
+        drive = os.path.splitdrive(os.path.abspath(filepath))[0]
+        return bool(drive) and not _drive_is_local(drive.upper())
+    return False
+
+# Version specifier parser (e.g. '>=1.2.3'), compiled once for check_package_installed
+_VERSION_SPEC_RE = re.compile(r'(>=|<=|==|>|<|~=)?\s*([\d\.]+)')
+_DIST_NAME_SEP_RE = re.compile(r'[-_.]+')
+
 # List of required dependencies (for core functionality)
 REQUIRED_DEPENDENCIES = [
     ("pandas", HAS_PANDAS),
@@ -193,6 +469,9 @@ OPTIONAL_DEPENDENCIES = [
     ("pythoncom", HAS_PYTHONCOM),
     ("odfpy", HAS_ODF),
     ("pyxlsb", HAS_PYXLSB),
+    ("python-calamine", HAS_CALAMINE),
+    ("charset-normalizer", HAS_CHARSET_NORMALIZER),
+    ("XlsxWriter", HAS_XLSXWRITER),
 ]
 
 def get_missing_dependencies():
@@ -203,63 +482,72 @@ def get_missing_optional_dependencies():
     missing = [name for name, flag in OPTIONAL_DEPENDENCIES if not flag]
     return missing
 
-@lru_cache(maxsize=128)
-def check_package_installed(pkg_name, import_name=None, version_spec=None):
-    # If running as a frozen executable, consider core packages as installed
-    if getattr(sys, 'frozen', False):
-        core_packages = ["pandas", "openpyxl", "xlrd", "packaging"]
-        if pkg_name in core_packages:
-            return True
-    
-    # Use importlib to check for presence
-    import importlib.util
-    mod_name = import_name or pkg_name.replace('-', '_')
-    
-    # First try direct import which is more reliable
-    try:
-        __import__(mod_name)
-        if not version_spec:
-            return True
-    except ImportError:
-        # If direct import fails, check with find_spec
-        spec = importlib.util.find_spec(mod_name)
-        if spec is None:
-            return False
-        # If version is not specified, just presence is enough
-        if not version_spec:
-            return True
-    
-    # Try to get the installed version
+def _version_satisfies(installed_version, version_spec):
+    """Check an installed version string against a specifier such as '>=1.2.3'"""
+    if not HAS_PACKAGING:
+        return True  # No version parser available, fallback to presence
+    # Parse version specifier (e.g., '>=1.2.3')
+    match = _VERSION_SPEC_RE.match(version_spec.strip())
+    if not match:
+        return True  # If we can't parse, fallback to presence
+    op, required_version = match.groups()
     try:
-        installed_version = importlib_metadata.version(pkg_name)
-        # Parse version specifier (e.g., '>=1.2.3')
-        import re
-        from packaging import version as packaging_version
-        match = re.match(r'(>=|<=|==|>|<|~=)?\s*([\d\.]+)', version_spec.strip())
-        if match:
-            op, required_version = match.groups()
-            op = op or '=='
-            if op == '==':
-                return packaging_version.parse(installed_version) == packaging_version.parse(required_version)
-            elif op == '>=':
-                return packaging_version.parse(installed_version) >= packaging_version.parse(required_version)
-            elif op == '<=':
-                return packaging_version.parse(installed_version) <= packaging_version.parse(required_version)
-            elif op == '>':
-                return packaging_version.parse(installed_version) > packaging_version.parse(required_version)
-            elif op == '<':
-                return packaging_version.parse(installed_version) < packaging_version.parse(required_version)
-            elif op == '~=':
-                # Compatible release, e.g., ~=1.4 means >=1.4, ==1.*k
-                return packaging_version.parse(installed_version) >= packaging_version.parse(required_version)
-            else:
-                return True  # Unknown operator, fallback to True
-        else:
-            return True  # If we can't parse, fallback to presence
-    except Exception:
-        # If we can't get version but we know the package is present, consider it installed
+        installed = packaging_version.parse(installed_version)
+        required = packaging_version.parse(required_version)
+    except packaging_version.InvalidVersion:
+        # If the version can't be compared but the package is present, consider it installed
+        return True
+    op = op or '=='
+    if op == '==':
+        return installed == required
+    elif op == '>=':
+        return installed >= required
+    elif op == '<=':
+        return installed <= required
+    elif op == '>':
+        return installed > required
+    elif op == '<':
+        return installed < required
+    elif op == '~=':
+        # Compatible release, e.g., ~=1.4 means >=1.4, ==1.*k
+        return installed >= required
+    else:
+        return True  # Unknown operator, fallback to True
+
+def _normalize_dist_name(name):
+    """Normalize a distribution name so 'python_Levenshtein' and 'python-levenshtein' compare equal"""
+    return _DIST_NAME_SEP_RE.sub('-', name).lower()
+
+def _snapshot_installed_versions():
+    """Read {distribution name: version} for every installed distribution in one scan"""
+    versions = {}
+    for dist in importlib_metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            versions.setdefault(_normalize_dist_name(name), dist.version)
+    return versions
+
+def check_package_installed(dep, snapshot):
+    """Whether a DEPENDENCY_INFO entry is present and meets its version spec, using a _snapshot_installed_versions() dict"""
+    pkg_name = dep["name"]
+    version_spec = dep.get("version")
+    if _FROZEN and pkg_name in _FROZEN_CORE:
+        return True
+
+    # Presence is a find_spec lookup so probing never imports pandas and friends;
+    # frozen builds may not expose specs for bundled modules, so they try a real import
+    mod_name = dep.get("import") or pkg_name.replace('-', '_')
+    if not _module_available(mod_name) and not (_FROZEN and _module_importable(mod_name)):
+        return False
+    if not version_spec:
         return True
 
+    installed_version = snapshot.get(_normalize_dist_name(pkg_name))
+    if installed_version is None:
+        # Present but without metadata, consider it installed
+        return True
+    return _version_satisfies(installed_version, version_spec)
+
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
     try:
@@ -268,6 +556,26 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+class _TextPeer(tk.Text):
+    """Scrolled Text widget showing the same content as an existing Text (a Tk text peer).
+
+    Both tabs show the same log, and a peer shares the other widget's text store,
+    so each line is inserted and kept in memory once instead of once per tab.
+    Laid out like scrolledtext.ScrolledText: place it through its .frame attribute.
+    """
+    def __init__(self, master, peer_of, **kw):
+        self.frame = tk.Frame(master)
+        self.vbar = tk.Scrollbar(self.frame)
+        self.vbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Register the widget through the normal Text constructor, then replace the
+        # plain text Tk created at that path with a peer of peer_of
+        tk.Text.__init__(self, self.frame)
+        self.tk.call('destroy', self._w)
+        self.tk.call(peer_of, 'peer', 'create', self._w)
+        self.configure(yscrollcommand=self.vbar.set, **kw)
+        self.vbar['command'] = self.yview
+        self.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
 class ExcelComparisonTool:
     def __init__(self, root):
         self.root = root
@@ -310,6 +618,12 @@ class ExcelComparisonTool:
         else:
             self.root.state('normal')
         
+        # Shared Tk font objects for the tab builders (kept on self so they are not garbage collected)
+        self.font_bold10 = tkfont.Font(family=DEFAULT_FONT_FAMILY, size=DEFAULT_FONT_SIZES["normal"], weight="bold")
+        self.font_bold9 = tkfont.Font(family=DEFAULT_FONT_FAMILY, size=DEFAULT_FONT_SIZES["small"], weight="bold")
+        self.font_bold8 = tkfont.Font(family=DEFAULT_FONT_FAMILY, size=DEFAULT_FONT_SIZES["tiny"], weight="bold")
+        self.font_body8 = tkfont.Font(family=DEFAULT_FONT_FAMILY, size=DEFAULT_FONT_SIZES["tiny"])
+        
         # Variables
         self.master_file_path = tk.StringVar()
         self.secondary_file_path = tk.StringVar()
@@ -318,9 +632,56 @@ class ExcelComparisonTool:
         self.master_columns = []
         self.secondary_columns = []
         self.result_df = None
+        self.secondary_work = None
         self.dependency_tab = None
         self.dependency_text = None
         self.dependency_install_btn = None
+        # Last (status text, tag) written to each dependency row, so refreshes only touch rows that changed
+        self._dep_last_state = [None] * len(DEPENDENCY_INFO)
+        # pip worker threads push output lines (and finish callbacks) here; drained on the Tk thread
+        self._dependency_log_queue = queue.Queue()
+        # log_message buffers entries here; _flush_logs writes them out at most every 50 ms
+        self._log_buffer = deque()
+        # >0 while a batch operation (auto-detect) is muting routine log lines
+        self._log_suspend_depth = 0
+        self._log_flush_scheduled = False
+        # Lines currently shown in the target/replace listboxes, used to diff updates
+        self._target_rendered = []
+        self._replace_rendered = []
+        # A mapping display rebuild is queued via root.after
+        self._mapping_update_pending = False
+        # Options & Processing settings; the tab's widgets are only built when it is first opened
+        self.fuzzy_matching = tk.BooleanVar(value=True)
+        self.similarity_threshold = tk.DoubleVar(value=0.8)
+        self.enable_multivalue = tk.BooleanVar(value=False)
+        self.target_delimiter = tk.StringVar(value=",")
+        self.preserve_structure = tk.BooleanVar(value=True)
+        self.replace_col_value = tk.StringVar()
+        self._undo_col_data = None
+        self._undo_col_name = None
+        self.log_text = None
+        self.log_text_mapping = None
+        self.replace_col_combo = None
+        # id(DataFrame) -> (its columns Index, tuple of column names), see _cols
+        self._cols_cache = {}
+        # Combobox widget name -> values tuple last assigned by _set_combo_values
+        self._combo_values = {}
+        # Notebook tab widget name -> builder for tabs not built yet
+        self._deferred_tabs = {}
+        # Cleaned target name -> closest_match result, reset for every processing run
+        # together with the fuzzy settings it was computed with
+        self._match_cache = {}
+        self._match_threshold = 0.8
+        self._match_fuzzy = True
+        # Length window -> master names that fit it, see windowed_choices
+        self._window_cache = OrderedDict()
+        # filepath -> (mtime_ns, first 8 bytes, {engine: open pd.ExcelFile}), see _open_workbook
+        self._wb_cache = {}
+        # Callables queued by load workers for the Tk thread, see _call_on_main
+        self._main_calls = queue.Queue()
+        self._loading = False
+        # The COM fallback drives a single shared Excel instance
+        self._com_lock = threading.Lock()
         
         self.setup_gui()
         # After GUI setup, check for missing dependencies
@@ -354,7 +715,14 @@ class ExcelComparisonTool:
         # Tab 2: Options & Processing
         self.options_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.options_tab, text="Options & Processing")
-        self.setup_options_tab(self.options_tab)
+        self._deferred_tabs[str(self.options_tab)] = self.setup_options_tab
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+    def on_tab_changed(self, event=None):
+        """Build a deferred tab the first time it is selected"""
+        builder = self._deferred_tabs.pop(self.notebook.select(), None)
+        if builder:
+            builder(self.notebook.nametowidget(self.notebook.select()))
 
     def setup_dependency_tab(self, parent):
         parent.columnconfigure(0, weight=1)
@@ -370,53 +738,34 @@ class ExcelComparisonTool:
         ttk.Label(header_frame, text=f"Version: {current_version}", font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZES["small"]), foreground=COLORS["info"]).grid(row=0, column=1, sticky=tk.E)
         
         # Different message for frozen vs non-frozen environment
-        if getattr(sys, 'frozen', False):
+        if _FROZEN:
             ttk.Label(parent, text="This is a packaged application with all dependencies included.\nNo installation is required.", font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZES["small"])).grid(row=1, column=0, sticky=tk.W, padx=10)
         else:
-            ttk.Label(parent, text="Below is a list of required and optional dependencies for this tool.\nSelect any to install, or use Install All for all missing dependencies.", font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZES["small"])).grid(row=1, column=0, sticky=tk.W, padx=10)
+            ttk.Label(parent, text="Below is a list of required and optional dependencies for this tool.\nSelect missing packages (Ctrl/Shift+click) to install, or use Install All for all missing dependencies.", font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZES["small"])).grid(row=1, column=0, sticky=tk.W, padx=10)
 
-        # Dependency grid with checkboxes
+        # Dependency table, one row per package (row iid is its DEPENDENCY_INFO index)
         grid_frame = ttk.Frame(parent)
         grid_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=(5, 5))
-        grid_frame.columnconfigure(0, weight=0)
-        grid_frame.columnconfigure(1, weight=0)
-        grid_frame.columnconfigure(2, weight=0)
-        grid_frame.columnconfigure(3, weight=1)
-        grid_frame.columnconfigure(4, weight=0)
-
-        headers = ["Select", "Package", "Required", "Purpose", "Status"]
-        for col, header in enumerate(headers):
-            ttk.Label(grid_frame, text=header, font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZES["normal"], "bold")).grid(row=0, column=col, sticky=tk.W, padx=2, pady=2)
-
-        self.dep_vars = []
-        self.dep_labels = []
+        grid_frame.columnconfigure(0, weight=1)
+        grid_frame.rowconfigure(0, weight=1)
+
+        self.dep_tree = ttk.Treeview(grid_frame, columns=("pkg", "req", "purpose", "status"), show="headings",
+                                     selectmode="extended", height=len(DEPENDENCY_INFO))
+        for col, header, width, stretch in (("pkg", "Package", 220, False), ("req", "Required", 70, False),
+                                            ("purpose", "Purpose", 320, True), ("status", "Status", 80, False)):
+            self.dep_tree.heading(col, text=header, anchor=tk.W)
+            self.dep_tree.column(col, width=width, stretch=stretch, anchor=tk.W)
+        self.dep_tree.tag_configure("installed", foreground=COLORS["success"])
+        self.dep_tree.tag_configure("missing", foreground=COLORS["error"])
         for i, dep in enumerate(DEPENDENCY_INFO):
-            var = tk.BooleanVar()
-            self.dep_vars.append(var)
-            installed = check_package_installed(dep["name"], dep.get("import"), dep.get("version"))
-            status = "Installed" if installed else "Missing"
-            color = COLORS["success"] if installed else COLORS["error"]
-            # Checkbox
-            cb = ttk.Checkbutton(grid_frame, variable=var)
-            cb.grid(row=i+1, column=0, sticky=tk.W, padx=2)
-            if installed:
-                cb.state(["disabled"])
             # Package name with version
             pkg_label = dep["name"]
             if dep.get("version"):
                 pkg_label += f" ({dep['version']})"
-            lbl_pkg = ttk.Label(grid_frame, text=pkg_label, foreground=color)
-            lbl_pkg.grid(row=i+1, column=1, sticky=tk.W, padx=2)
-            # Required
-            lbl_req = ttk.Label(grid_frame, text="Yes" if dep["required"] else "No", foreground=color)
-            lbl_req.grid(row=i+1, column=2, sticky=tk.W, padx=2)
-            # Purpose
-            lbl_purp = ttk.Label(grid_frame, text=dep["desc"], foreground=color)
-            lbl_purp.grid(row=i+1, column=3, sticky=tk.W, padx=2)
-            # Status
-            lbl_stat = ttk.Label(grid_frame, text=status, foreground=color)
-            lbl_stat.grid(row=i+1, column=4, sticky=tk.W, padx=2)
-            self.dep_labels.append((lbl_pkg, lbl_req, lbl_purp, lbl_stat, cb))
+            # Status and colour are filled in by refresh_dependency_status below
+            self.dep_tree.insert("", tk.END, iid=str(i), values=(pkg_label, "Yes" if dep["required"] else "No", dep["desc"], ""))
+        self.dep_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.dep_tree.bind("<<TreeviewSelect>>", self.on_dependency_selected)
 
         # Legend
         legend_frame = ttk.Frame(parent)
@@ -452,38 +801,52 @@ class ExcelComparisonTool:
         parent.rowconfigure(5, weight=1)
 
         self.refresh_dependency_status()
+        self.root.after(50, self._drain_dependency_log_queue)
 
     def refresh_dependency_status(self):
         # If running as a frozen executable, mark all dependencies as installed
-        if getattr(sys, 'frozen', False):
+        if _FROZEN:
             for i, dep in enumerate(DEPENDENCY_INFO):
-                color = COLORS["success"]
-                self.dep_labels[i][0].config(foreground=color)  # pkg
-                self.dep_labels[i][1].config(foreground=color)  # req
-                self.dep_labels[i][2].config(foreground=color)  # purpose
-                self.dep_labels[i][3].config(foreground=color, text="Included")  # status
-                self.dep_labels[i][4].state(["disabled"])
-                self.dep_vars[i].set(False)
+                self._set_dependency_row(i, "Included", "installed")
+            self.dep_tree.selection_set(())
             return
             
         # Normal dependency check for non-frozen environment
-        for i, dep in enumerate(DEPENDENCY_INFO):
-            installed = check_package_installed(dep["name"], dep.get("import"), dep.get("version"))
-            color = COLORS["success"] if installed else COLORS["error"]
-            self.dep_labels[i][0].config(foreground=color)  # pkg
-            self.dep_labels[i][1].config(foreground=color)  # req
-            self.dep_labels[i][2].config(foreground=color)  # purpose
-            self.dep_labels[i][3].config(foreground=color, text="Installed" if installed else "Missing")  # status
-            if installed:
-                self.dep_labels[i][4].state(["disabled"])
-                self.dep_vars[i].set(False)
-            else:
-                self.dep_labels[i][4].state(["!disabled"])
+        for i, (dep, installed) in enumerate(self._current_status()):
+            if self._set_dependency_row(i, *(("Installed", "installed") if installed else ("Missing", "missing"))) and installed:
+                self.dep_tree.selection_remove(str(i))
+
+    def _set_dependency_row(self, i, status, tag):
+        """Update one dependency row; returns False without touching the widget if nothing changed"""
+        new_state = (status, tag)
+        if self._dep_last_state[i] == new_state:
+            return False
+        self.dep_tree.set(str(i), "status", status)
+        self.dep_tree.item(str(i), tags=(tag,))
+        self._dep_last_state[i] = new_state
+        return True
+
+    def on_dependency_selected(self, event=None):
+        """Only missing packages can be selected for installation"""
+        installed = [iid for iid in self.dep_tree.selection() if self.dep_tree.tag_has("installed", iid)]
+        if installed:
+            self.dep_tree.selection_remove(installed)
+
+    def _current_status(self):
+        """(dep, installed) for every DEPENDENCY_INFO entry, from a single probe pass"""
+        snapshot = _snapshot_installed_versions()
+        return [(dep, check_package_installed(dep, snapshot)) for dep in DEPENDENCY_INFO]
+
+    @staticmethod
+    def _pip_requirement(dep):
+        return dep["name"] + dep["version"] if dep.get("version") else dep["name"]
 
     def install_selected_dependencies(self):
-        selected = [dep["name"] + dep["version"] if dep.get("version") else dep["name"]
-                    for dep, var in zip(DEPENDENCY_INFO, self.dep_vars)
-                    if var.get() and not check_package_installed(dep["name"], dep.get("import"), dep.get("version"))]
+        # Row iids are DEPENDENCY_INFO indexes; the tree selection is the only copy of the choice
+        chosen = {int(iid) for iid in self.dep_tree.selection()}
+        selected = [self._pip_requirement(dep)
+                    for i, (dep, installed) in enumerate(self._current_status())
+                    if i in chosen and not installed]
         if not selected:
             messagebox.showinfo("No Selection", "Please select at least one missing dependency to install.")
             return
@@ -491,14 +854,13 @@ class ExcelComparisonTool:
 
     def install_missing_dependencies(self):
         # Install all missing dependencies (required and optional)
-        missing = [dep["name"] + dep["version"] if dep.get("version") else dep["name"]
-                  for dep in DEPENDENCY_INFO if not check_package_installed(dep["name"], dep.get("import"), dep.get("version"))]
+        missing = [self._pip_requirement(dep) for dep, installed in self._current_status() if not installed]
         if not missing:
             return
         self._install_dependencies(missing)
 
     def _install_dependencies(self, dep_list):
-        if getattr(sys, 'frozen', False):
+        if _FROZEN:
             self.dependency_text.config(state=tk.NORMAL)
             self.dependency_text.delete(1.0, tk.END)
             self.dependency_text.insert(tk.END, "This is a packaged application. Dependencies are already included.\n")
@@ -517,54 +879,43 @@ class ExcelComparisonTool:
         self.dependency_text.delete(1.0, tk.END)
         self.dependency_text.insert(tk.END, f"Installing: {', '.join(dep_list)}\n\n")
         self.dependency_text.see(tk.END)
-        self.dependency_text.update_idletasks()
+        self.dependency_text.config(state=tk.DISABLED)
         self.root.update_idletasks()
 
         def run_install():
-            for dep in dep_list:
-                self.dependency_text.insert(tk.END, f"Installing {dep}...\n")
-                self.dependency_text.see(tk.END)
-                self.dependency_text.update_idletasks()
-                self.root.update_idletasks()
-                try:
-                    process = subprocess.Popen([
-                        sys.executable, "-m", "pip", "install", dep
-                    ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-                    for line in process.stdout:
-                        self.dependency_text.insert(tk.END, line)
-                        self.dependency_text.see(tk.END)
-                        self.dependency_text.update_idletasks()
-                        self.root.update_idletasks()
-                    process.wait()
-                    if process.returncode == 0:
-                        self.dependency_text.insert(tk.END, f"{dep} installed successfully.\n\n")
-                        if dep.startswith("pywin32"):
-                            self.dependency_text.insert(tk.END, "Running pywin32_postinstall...\n")
-                            self.dependency_text.see(tk.END)
-                            self.dependency_text.update_idletasks()
-                            self.root.update_idletasks()
-                            try:
-                                subprocess.run([
-                                    sys.executable, "-m", "pywin32_postinstall", "-install"
-                                ], check=False)
-                                self.dependency_text.insert(tk.END, "pywin32_postinstall completed.\n")
-                            except Exception as e:
-                                self.dependency_text.insert(
-                                    tk.END,
-                                    f"pywin32_postinstall not found or failed: {e}\n"
-                                    "If you encounter issues, try running the postinstall script manually or consult pywin32 documentation.\n"
-                                )
-                    else:
-                        self.dependency_text.insert(tk.END, f"Failed to install {dep}.\n\n")
-                except Exception as e:
-                    self.dependency_text.insert(tk.END, f"Error installing {dep}: {e}\n\n")
-                self.dependency_text.see(tk.END)
-                self.dependency_text.update_idletasks()
-                self.root.update_idletasks()
-            self.dependency_text.insert(tk.END, "\nInstallation complete. Please restart the application to use all features.")
-            self.dependency_text.see(tk.END)
-            self.dependency_text.update_idletasks()
-            self.root.update_idletasks()
+            self._append_dependency_text(f"Installing {len(dep_list)} package(s) in a single pip run...\n")
+            try:
+                # One pip invocation resolves and downloads everything together
+                process = subprocess.Popen([
+                    sys.executable, "-m", "pip", "install",
+                    "--disable-pip-version-check", "--no-input", *dep_list
+                ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+                self._stream_process_output(process)
+                process.wait()
+                if process.returncode == 0:
+                    self._append_dependency_text(f"{', '.join(dep_list)} installed successfully.\n\n")
+                    if any(dep.startswith("pywin32") for dep in dep_list):
+                        self._append_dependency_text("Running pywin32_postinstall...\n")
+                        try:
+                            subprocess.run([
+                                sys.executable, "-m", "pywin32_postinstall", "-install"
+                            ], check=False)
+                            self._append_dependency_text("pywin32_postinstall completed.\n")
+                        except Exception as e:
+                            self._append_dependency_text(
+                                f"pywin32_postinstall not found or failed: {e}\n"
+                                "If you encounter issues, try running the postinstall script manually or consult pywin32 documentation.\n"
+                            )
+                else:
+                    self._append_dependency_text(f"Failed to install: {', '.join(dep_list)}.\n\n")
+            except Exception as e:
+                self._append_dependency_text(f"Error installing dependencies: {e}\n\n")
+            self._append_dependency_text("\nInstallation complete. Please restart the application to use all features.")
+            # Installed packages changed, drop importlib's cached directory listings
+            importlib.invalidate_caches()
+            self._dependency_log_queue.put(finish_install)
+
+        def finish_install():
             self.refresh_dependency_status()
             self.dependency_install_btn.config(state=tk.NORMAL)
             self.dependency_selected_btn.config(state=tk.NORMAL)
@@ -573,7 +924,7 @@ class ExcelComparisonTool:
 
     def uninstall_installed_dependencies(self):
         # Uninstall all currently installed dependencies in DEPENDENCY_INFO
-        installed = [dep["name"] for dep in DEPENDENCY_INFO if check_package_installed(dep["name"], dep.get("import"), dep.get("version"))]
+        installed = [dep["name"] for dep, is_installed in self._current_status() if is_installed]
         if not installed:
             messagebox.showinfo("No Installed Packages", "No dependencies are currently installed.")
             return
@@ -588,7 +939,7 @@ class ExcelComparisonTool:
         self._uninstall_dependencies(installed)
 
     def _uninstall_dependencies(self, dep_list):
-        if getattr(sys, 'frozen', False):
+        if _FROZEN:
             self.dependency_text.config(state=tk.NORMAL)
             self.dependency_text.delete(1.0, tk.END)
             self.dependency_text.insert(tk.END, "This is a packaged application. Dependencies cannot be uninstalled.\n")
@@ -608,38 +959,29 @@ class ExcelComparisonTool:
         self.dependency_text.delete(1.0, tk.END)
         self.dependency_text.insert(tk.END, f"Uninstalling: {', '.join(dep_list)}\n\n")
         self.dependency_text.see(tk.END)
-        self.dependency_text.update_idletasks()
+        self.dependency_text.config(state=tk.DISABLED)
         self.root.update_idletasks()
 
         def run_uninstall():
-            for dep in dep_list:
-                self.dependency_text.insert(tk.END, f"Uninstalling {dep}...\n")
-                self.dependency_text.see(tk.END)
-                self.dependency_text.update_idletasks()
-                self.root.update_idletasks()
-                try:
-                    process = subprocess.Popen([
-                        sys.executable, "-m", "pip", "uninstall", "-y", dep
-                    ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-                    for line in process.stdout:
-                        self.dependency_text.insert(tk.END, line)
-                        self.dependency_text.see(tk.END)
-                        self.dependency_text.update_idletasks()
-                        self.root.update_idletasks()
-                    process.wait()
-                    if process.returncode == 0:
-                        self.dependency_text.insert(tk.END, f"{dep} uninstalled successfully.\n\n")
-                    else:
-                        self.dependency_text.insert(tk.END, f"Failed to uninstall {dep}.\n\n")
-                except Exception as e:
-                    self.dependency_text.insert(tk.END, f"Error uninstalling {dep}: {e}\n\n")
-                self.dependency_text.see(tk.END)
-                self.dependency_text.update_idletasks()
-                self.root.update_idletasks()
-            self.dependency_text.insert(tk.END, "\nUninstallation complete. You may need to reinstall dependencies to use the application.")
-            self.dependency_text.see(tk.END)
-            self.dependency_text.update_idletasks()
-            self.root.update_idletasks()
+            self._append_dependency_text(f"Uninstalling {len(dep_list)} package(s) in a single pip run...\n")
+            try:
+                process = subprocess.Popen([
+                    sys.executable, "-m", "pip", "uninstall", "-y",
+                    "--disable-pip-version-check", *dep_list
+                ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+                self._stream_process_output(process)
+                process.wait()
+                if process.returncode == 0:
+                    self._append_dependency_text(f"{', '.join(dep_list)} uninstalled successfully.\n\n")
+                else:
+                    self._append_dependency_text(f"Failed to uninstall: {', '.join(dep_list)}.\n\n")
+            except Exception as e:
+                self._append_dependency_text(f"Error uninstalling dependencies: {e}\n\n")
+            self._append_dependency_text("\nUninstallation complete. You may need to reinstall dependencies to use the application.")
+            importlib.invalidate_caches()
+            self._dependency_log_queue.put(finish_uninstall)
+
+        def finish_uninstall():
             self.refresh_dependency_status()
             self.dependency_uninstall_btn.config(state=tk.NORMAL)
             self.dependency_install_btn.config(state=tk.NORMAL)
@@ -647,9 +989,37 @@ class ExcelComparisonTool:
             messagebox.showinfo("Uninstall Complete", "Dependencies uninstalled. Please reinstall them to use the application.")
         threading.Thread(target=run_uninstall, daemon=True).start()
 
+    def _append_dependency_text(self, text):
+        """Queue text for the dependency output box; safe to call from the pip worker thread"""
+        self._dependency_log_queue.put(text)
+
+    def _stream_process_output(self, process):
+        """Forward subprocess output lines to the dependency output box"""
+        for line in process.stdout:
+            self._dependency_log_queue.put(line)
+
+    def _drain_dependency_log_queue(self):
+        """Append everything queued by pip workers in one insert, then run any queued callbacks"""
+        items = []
+        try:
+            while True:
+                items.append(self._dependency_log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        text = "".join(item for item in items if isinstance(item, str))
+        if text:
+            self.dependency_text.config(state=tk.NORMAL)
+            self.dependency_text.insert(tk.END, text)
+            self.dependency_text.see(tk.END)
+            self.dependency_text.config(state=tk.DISABLED)
+        for item in items:
+            if callable(item):
+                item()
+        self.root.after(50, self._drain_dependency_log_queue)
+
     def check_and_handle_dependencies(self):
         # If running as a frozen executable, bypass dependency check
-        if getattr(sys, 'frozen', False):
+        if _FROZEN:
             # Enable all tabs
             self.notebook.tab(1, state="normal")
             self.notebook.tab(2, state="normal")
@@ -695,18 +1065,18 @@ class ExcelComparisonTool:
         
         # Compact File Selection section - redesigned to take less space
         file_frame = ttk.Frame(parent)  # Removed LabelFrame to save space
-        file_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        file_frame.grid(row=0, column=0, sticky=WE, pady=(0, 5))
         file_frame.columnconfigure(1, weight=1)
         
         # More compact file selection layout
         ttk.Label(file_frame, text="Reference File:").grid(row=0, column=0, sticky=tk.W, pady=2)
         file_entry1 = ttk.Entry(file_frame, textvariable=self.master_file_path)
-        file_entry1.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5)
+        file_entry1.grid(row=0, column=1, sticky=WE, padx=5)
         ttk.Button(file_frame, text="Browse", command=self.browse_master_file, width=8).grid(row=0, column=2)
         
         ttk.Label(file_frame, text="Target File:").grid(row=1, column=0, sticky=tk.W, pady=2)
         file_entry2 = ttk.Entry(file_frame, textvariable=self.secondary_file_path)
-        file_entry2.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=5)
+        file_entry2.grid(row=1, column=1, sticky=WE, padx=5)
         ttk.Button(file_frame, text="Browse", command=self.browse_secondary_file, width=8).grid(row=1, column=2)
         
         # Load files button on the same row to save space
@@ -719,17 +1089,17 @@ class ExcelComparisonTool:
         # Add a smaller Results & Log section at the bottom
         # --- Header frame for Results & Log ---
         results_header = ttk.Frame(parent)
-        results_header.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(8, 0), padx=2)
+        results_header.grid(row=2, column=0, sticky=WE, pady=(8, 0), padx=2)
         results_header.columnconfigure(0, weight=1)
-        ttk.Label(results_header, text="Results & Log", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(results_header, text="Results & Log", font=self.font_bold10).grid(row=0, column=0, sticky=tk.W)
         ttk.Button(results_header, text="Clear Log (Ctrl+L)", command=self.clear_logs, width=10).grid(row=0, column=1, sticky=tk.E, padx=(0, 2))
         # --- Log area below header ---
         results_frame = ttk.Frame(parent, padding="0")
-        results_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5)
+        results_frame.grid(row=3, column=0, columnspan=2, sticky=NSEW, padx=5)
         results_frame.columnconfigure(0, weight=1)
         results_frame.rowconfigure(0, weight=1)
         self.log_text_mapping = scrolledtext.ScrolledText(results_frame, height=8)
-        self.log_text_mapping.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.log_text_mapping.grid(row=0, column=0, sticky=NSEW)
 
     def setup_improved_mapping(self, parent):
         """Setup an improved column mapping interface with better layout"""
@@ -737,11 +1107,14 @@ class ExcelComparisonTool:
         self.selected_reference_primary = tk.StringVar()
         self.selected_target_columns = []
         self.selected_replace_columns = []
+        # Set mirrors of the two lists above for constant-time duplicate checks
+        self._target_set = set()
+        self._replace_set = set()
         self.selected_data_source = tk.StringVar()
         
         # Main mapping frame
         mapping_frame = ttk.LabelFrame(parent, text="Column Mapping", padding="10")
-        mapping_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 5))
+        mapping_frame.grid(row=1, column=0, sticky=NSEW, pady=(0, 5))
         mapping_frame.columnconfigure(0, weight=1)
         mapping_frame.columnconfigure(1, weight=1)
         mapping_frame.rowconfigure(1, weight=1)  # Give the selection section weight
@@ -756,103 +1129,96 @@ class ExcelComparisonTool:
         right_panel.columnconfigure(1, weight=1)  # Combobox column gets extra space
         
         # === LEFT PANEL: Reference file selections ===
-        ttk.Label(left_panel, text="Reference File Columns", font=("Arial", 9, "bold")).grid(
+        ttk.Label(left_panel, text="Reference File Columns", font=self.font_bold9).grid(
             row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
         
         ttk.Label(left_panel, text="Primary Match:").grid(row=1, column=0, sticky=tk.W, pady=2)
         self.ref_primary_combo = ttk.Combobox(left_panel, state="readonly")
-        self.ref_primary_combo.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2)
+        self.ref_primary_combo.grid(row=1, column=1, sticky=WE, pady=2)
         self.ref_primary_combo.bind('<<ComboboxSelected>>', self.on_reference_primary_selected)
         
         ttk.Label(left_panel, text="Data Source:").grid(row=2, column=0, sticky=tk.W, pady=2)
         self.ref_data_combo = ttk.Combobox(left_panel, state="readonly")
-        self.ref_data_combo.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=2)
+        self.ref_data_combo.grid(row=2, column=1, sticky=WE, pady=2)
         self.ref_data_combo.bind('<<ComboboxSelected>>', self.on_data_source_selected)
         
         # === RIGHT PANEL: Target file selections ===
-        ttk.Label(right_panel, text="Target File Columns", font=("Arial", 9, "bold")).grid(
+        ttk.Label(right_panel, text="Target File Columns", font=self.font_bold9).grid(
             row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, 5))
         
         ttk.Label(right_panel, text="Primary Match:").grid(row=1, column=0, sticky=tk.W, pady=2)
         self.target_primary_combo = ttk.Combobox(right_panel, state="readonly")
-        self.target_primary_combo.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
+        self.target_primary_combo.grid(row=1, column=1, sticky=WE, padx=(5, 5), pady=2)
         ttk.Button(right_panel, text="Add", command=self.on_target_primary_selected, width=8).grid(
             row=1, column=2, sticky=tk.E, pady=2)
         
         ttk.Label(right_panel, text="Additional Target:").grid(row=2, column=0, sticky=tk.W, pady=2)
         self.target_additional_combo = ttk.Combobox(right_panel, state="readonly")
-        self.target_additional_combo.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
+        self.target_additional_combo.grid(row=2, column=1, sticky=WE, padx=(5, 5), pady=2)
         ttk.Button(right_panel, text="Add", command=self.add_target_column, width=8).grid(
             row=2, column=2, sticky=tk.E, pady=2)
         
         ttk.Label(right_panel, text="Replace Column:").grid(row=3, column=0, sticky=tk.W, pady=2)
         self.target_replace_combo = ttk.Combobox(right_panel, state="readonly")
-        self.target_replace_combo.grid(row=3, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=2)
+        self.target_replace_combo.grid(row=3, column=1, sticky=WE, padx=(5, 5), pady=2)
         ttk.Button(right_panel, text="Add", command=self.add_replace_column, width=8).grid(
             row=3, column=2, sticky=tk.E, pady=2)
         
         # === SELECTION DISPLAY SECTION ===
         selection_section = ttk.Frame(mapping_frame)
-        selection_section.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
+        selection_section.grid(row=1, column=0, columnspan=2, sticky=NSEW, pady=(10, 0))
         selection_section.columnconfigure(0, weight=1)
         selection_section.columnconfigure(1, weight=1)
-        selection_section.columnconfigure(2, weight=1)
-        selection_section.rowconfigure(0, weight=1)  # Allow expansion vertically
+        selection_section.columnconfigure(3, weight=1)  # Summary value column
+        selection_section.rowconfigure(3, weight=1)  # Allow expansion vertically
         
         # Target Columns Display with scrollbar
         target_frame = ttk.LabelFrame(selection_section, text="Selected Target Columns")
-        target_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5))
+        target_frame.grid(row=0, column=0, rowspan=4, sticky=NSEW, padx=(0, 5))
         target_frame.columnconfigure(0, weight=1)
         target_frame.rowconfigure(0, weight=1)
         
         target_scroll = ttk.Scrollbar(target_frame, orient=tk.VERTICAL)
-        self.target_listbox = tk.Listbox(target_frame, height=5, font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZES["tiny"]), yscrollcommand=target_scroll.set)
+        self.target_listbox = tk.Listbox(target_frame, height=5, font=self.font_body8, yscrollcommand=target_scroll.set)
         target_scroll.config(command=self.target_listbox.yview)
-        self.target_listbox.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        target_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.target_listbox.grid(row=0, column=0, sticky=NSEW)
+        target_scroll.grid(row=0, column=1, sticky=NS)
         self.target_listbox.bind('<Double-Button-1>', self.remove_target_from_listbox)
         
         # Replace Columns Display with scrollbar
         replace_frame = ttk.LabelFrame(selection_section, text="Selected Replace Columns")
-        replace_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5)
+        replace_frame.grid(row=0, column=1, rowspan=4, sticky=NSEW, padx=5)
         replace_frame.columnconfigure(0, weight=1)
         replace_frame.rowconfigure(0, weight=1)
         
         replace_scroll = ttk.Scrollbar(replace_frame, orient=tk.VERTICAL)
-        self.replace_listbox = tk.Listbox(replace_frame, height=5, font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZES["tiny"]), yscrollcommand=replace_scroll.set)
+        self.replace_listbox = tk.Listbox(replace_frame, height=5, font=self.font_body8, yscrollcommand=replace_scroll.set)
         replace_scroll.config(command=self.replace_listbox.yview)
-        self.replace_listbox.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        replace_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.replace_listbox.grid(row=0, column=0, sticky=NSEW)
+        replace_scroll.grid(row=0, column=1, sticky=NS)
         self.replace_listbox.bind('<Double-Button-1>', self.remove_replace_from_listbox)
         
-        # Current Selection summary (Ref Primary and Data Source moved outside)
-        summary_outer = ttk.Frame(selection_section)
-        summary_outer.grid(row=0, column=2, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0))
-        summary_outer.columnconfigure(0, weight=1)
-        summary_outer.rowconfigure(1, weight=1)
-
-        # Heading and labels outside the box
-        heading_frame = ttk.Frame(summary_outer)
-        heading_frame.grid(row=0, column=0, sticky=tk.W)
-        ttk.Label(heading_frame, text="Current Selection", font=("Arial", 9, "bold")).pack(side=tk.LEFT)
-        ttk.Label(heading_frame, text="  Ref Primary:", font=("Arial", 8, "bold")).pack(side=tk.LEFT)
-        self.ref_primary_label = ttk.Label(heading_frame, text="None", foreground="blue", font=("Arial", 8))
-        self.ref_primary_label.pack(side=tk.LEFT, padx=(2, 8))
-        ttk.Label(heading_frame, text="Data Source:", font=("Arial", 8, "bold")).pack(side=tk.LEFT)
-        self.data_source_label = ttk.Label(heading_frame, text="None", foreground="green", font=("Arial", 8))
-        self.data_source_label.pack(side=tk.LEFT, padx=(2, 0))
-
-        # Mapping info box with scrollbar
-        summary_frame = ttk.LabelFrame(summary_outer, text="Data Mapping Chart")
-        summary_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(2, 0))
+        # Current Selection summary, gridded straight into columns 2-3 of the selection section
+        ttk.Label(selection_section, text="Current Selection", font=self.font_bold9).grid(
+            row=0, column=2, columnspan=2, sticky=tk.W, padx=(5, 0))
+        ttk.Label(selection_section, text="Ref Primary:", font=self.font_bold8).grid(row=1, column=2, sticky=tk.W, padx=(5, 0))
+        self.ref_primary_label = ttk.Label(selection_section, text="None", foreground="blue", font=self.font_body8)
+        self.ref_primary_label.grid(row=1, column=3, sticky=tk.W, padx=(2, 0))
+        ttk.Label(selection_section, text="Data Source:", font=self.font_bold8).grid(row=2, column=2, sticky=tk.W, padx=(5, 0))
+        self.data_source_label = ttk.Label(selection_section, text="None", foreground="green", font=self.font_body8)
+        self.data_source_label.grid(row=2, column=3, sticky=tk.W, padx=(2, 0))
+
+        # Mapping info box; a read-only label, rewritten through its StringVar
+        summary_frame = ttk.LabelFrame(selection_section, text="Data Mapping Chart")
+        summary_frame.grid(row=3, column=2, columnspan=2, sticky=NSEW, padx=(5, 0), pady=(2, 0))
         summary_frame.columnconfigure(0, weight=1)
         summary_frame.rowconfigure(0, weight=1)
-        mapping_scroll = ttk.Scrollbar(summary_frame, orient=tk.VERTICAL)
-        self.mapping_info = tk.Text(summary_frame, height=6, width=28, font=("Arial", 8), wrap=tk.WORD, yscrollcommand=mapping_scroll.set)
-        self.mapping_info.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        mapping_scroll.config(command=self.mapping_info.yview)
-        mapping_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.mapping_info.config(state=tk.DISABLED)
+        self._mapping_var = tk.StringVar()
+        self.mapping_info = ttk.Label(summary_frame, textvariable=self._mapping_var, font=self.font_body8,
+                                      justify=tk.LEFT, anchor=tk.NW, width=28)
+        self.mapping_info.grid(row=0, column=0, sticky=NSEW, padx=2, pady=2)
+        # Wrap long column names to the box width, as the Text widget did
+        self.mapping_info.bind('<Configure>', lambda e: self.mapping_info.config(wraplength=max(e.width - 4, 1)))
         
         # === CONTROL BUTTONS: Moved to bottom for better visibility ===
         control_frame = ttk.Frame(mapping_frame)
@@ -874,29 +1240,25 @@ class ExcelComparisonTool:
         # --- 2x2 Grid for Options ---
         # Top-left: Matching Options
         options_frame = ttk.LabelFrame(parent, text="Matching Options", padding="10")
-        options_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        options_frame.grid(row=0, column=0, sticky=NSEW, padx=5, pady=5)
         options_frame.columnconfigure(0, weight=1)
 
-        self.fuzzy_matching = tk.BooleanVar(value=True)
         ttk.Checkbutton(options_frame, text="Enable fuzzy name matching", variable=self.fuzzy_matching).grid(row=0, column=0, sticky=tk.W, pady=2)
         threshold_frame = ttk.Frame(options_frame)
-        threshold_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=2)
+        threshold_frame.grid(row=1, column=0, sticky=WE, pady=2)
         ttk.Label(threshold_frame, text="Similarity threshold (0.1-1.0):").pack(side=tk.LEFT)
-        self.similarity_threshold = tk.DoubleVar(value=0.8)
         similarity_spin = ttk.Spinbox(threshold_frame, from_=0.1, to=1.0, increment=0.1, width=6, textvariable=self.similarity_threshold)
         similarity_spin.pack(side=tk.LEFT, padx=(5, 0))
 
         # Top-right: Multi-Value Target Column Options
         multivalue_frame = ttk.LabelFrame(parent, text="Multi-Value Target Column Options", padding="10")
-        multivalue_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        multivalue_frame.grid(row=0, column=1, sticky=NSEW, padx=5, pady=5)
         multivalue_frame.columnconfigure(0, weight=1)
 
-        self.enable_multivalue = tk.BooleanVar(value=False)
         ttk.Checkbutton(multivalue_frame, text="Enable multi-value processing", variable=self.enable_multivalue, command=self.toggle_multivalue_options).grid(row=0, column=0, sticky=tk.W, pady=2)
         delimiter_frame = ttk.Frame(multivalue_frame)
-        delimiter_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=2)
+        delimiter_frame.grid(row=1, column=0, sticky=WE, pady=2)
         ttk.Label(delimiter_frame, text="Delimiter:").pack(side=tk.LEFT)
-        self.target_delimiter = tk.StringVar(value=",")
         delimiter_entry = ttk.Entry(delimiter_frame, textvariable=self.target_delimiter, width=4)
         delimiter_entry.pack(side=tk.LEFT, padx=(5, 0))
         common_delims = [(",", "Comma"), (";", "Semicolon"), ("|", "Pipe"), (" ", "Space")]
@@ -906,72 +1268,75 @@ class ExcelComparisonTool:
 
         # Bottom-left: Output Options
         structure_frame = ttk.LabelFrame(parent, text="Output Options", padding="10")
-        structure_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        structure_frame.grid(row=1, column=0, sticky=NSEW, padx=5, pady=5)
         structure_frame.columnconfigure(0, weight=1)
-        self.preserve_structure = tk.BooleanVar(value=True)
         ttk.Checkbutton(structure_frame, text="Preserve original file structure (only update matched columns)", variable=self.preserve_structure).grid(row=0, column=0, sticky=tk.W, pady=2)
 
         # Bottom-right: Processing & Export
         process_export_frame = ttk.LabelFrame(parent, text="Processing & Export", padding="10")
-        process_export_frame.grid(row=1, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+        process_export_frame.grid(row=1, column=1, sticky=NSEW, padx=5, pady=5)
         process_export_frame.columnconfigure(0, weight=1)
         ttk.Button(process_export_frame, text="Process & Match Data (Ctrl+P)", command=self.process_data, style="Accent.TButton", width=22).grid(row=0, column=0, pady=(0, 8), sticky=tk.EW)
         ttk.Button(process_export_frame, text="Export Results to Excel/CSV (Ctrl+E)", command=self.export_results, width=22).grid(row=1, column=0, pady=(0, 2), sticky=tk.EW)
 
         # --- Move: Replace Column Values Section above log ---
         replace_col_frame = ttk.LabelFrame(parent, text="Replace Entire Column in Processed Target File", padding="10")
-        replace_col_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=(5, 10))
+        replace_col_frame.grid(row=2, column=0, columnspan=2, sticky=WE, padx=5, pady=(5, 10))
         replace_col_frame.columnconfigure(1, weight=1)
         ttk.Label(replace_col_frame, text="Column:").grid(row=0, column=0, sticky=tk.W)
         self.replace_col_combo = ttk.Combobox(replace_col_frame, state="readonly", width=28)
-        self.replace_col_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5)
+        self.replace_col_combo.grid(row=0, column=1, sticky=WE, padx=5)
         ttk.Label(replace_col_frame, text="Value:").grid(row=0, column=2, sticky=tk.W)
-        self.replace_col_value = tk.StringVar()
-        ttk.Entry(replace_col_frame, textvariable=self.replace_col_value, width=18).grid(row=0, column=3, sticky=(tk.W, tk.E), padx=5)
+        ttk.Entry(replace_col_frame, textvariable=self.replace_col_value, width=18).grid(row=0, column=3, sticky=WE, padx=5)
         self.replace_col_btn = ttk.Button(replace_col_frame, text="Replace Column", command=self.replace_entire_column, state="disabled")
         self.replace_col_btn.grid(row=0, column=4, padx=5)
         self.preview_col_btn = ttk.Button(replace_col_frame, text="Preview", command=self.preview_replace_column, state="disabled")
         self.preview_col_btn.grid(row=0, column=5, padx=5)
         self.undo_col_btn = ttk.Button(replace_col_frame, text="Undo", command=self.undo_replace_column, state="disabled")
         self.undo_col_btn.grid(row=0, column=6, padx=5)
-        self._undo_col_data = None
-        self._undo_col_name = None
 
         # --- Tall Results/Logs Section ---
         # --- Header frame for Results & Log ---
         results_header = ttk.Frame(parent)
-        results_header.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=(10, 0))
+        results_header.grid(row=3, column=0, columnspan=2, sticky=WE, padx=5, pady=(10, 0))
         results_header.columnconfigure(0, weight=1)
-        ttk.Label(results_header, text="Results & Log", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(results_header, text="Results & Log", font=self.font_bold10).grid(row=0, column=0, sticky=tk.W)
         ttk.Button(results_header, text="Check for Updates (Ctrl+U)", command=self.check_for_updates, width=15).grid(row=0, column=1, sticky=tk.E, padx=(0, 5))
         ttk.Button(results_header, text="Clear Log (Ctrl+L)", command=self.clear_logs, width=10).grid(row=0, column=2, sticky=tk.E, padx=(0, 2))
         # --- Log area below header ---
         results_frame = ttk.Frame(parent, padding="0")
-        results_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5)
+        results_frame.grid(row=4, column=0, columnspan=2, sticky=NSEW, padx=5)
         results_frame.columnconfigure(0, weight=1)
         results_frame.rowconfigure(0, weight=1)
-        self.log_text = scrolledtext.ScrolledText(results_frame, height=12)
-        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Peer of the mapping tab's log: one text store, already holding everything logged so far
+        self.log_text = _TextPeer(results_frame, self.log_text_mapping, height=12)
+        self.log_text.frame.grid(row=0, column=0, sticky=NSEW)
+        self.log_text.see(tk.END)
         self.toggle_multivalue_options()
+        self.update_replace_col_combo(log=False)
 
-    def update_replace_col_combo(self):
+    def update_replace_col_combo(self, log=True):
         # Update the replace_col_combo dropdown with columns from self.secondary_work
-        if hasattr(self, 'secondary_work') and self.secondary_work is not None:
-            cols = list(self.secondary_work.columns)
-            self.replace_col_combo['values'] = cols
+        if self.secondary_work is not None:
+            cols = self._cols(self.secondary_work)
+            if log:
+                self.log_message(f"Available columns for replacement: {list(cols)}", "INFO")
+            if self.replace_col_combo is None:
+                return  # Options tab not built yet; it fills the combo when it is
+            self._set_combo_values(self.replace_col_combo, cols)
             self.replace_col_btn.config(state="normal")
             self.preview_col_btn.config(state="normal")
-            self.log_message(f"Available columns for replacement: {cols}", "INFO")
-            self.replace_col_combo.update_idletasks()
-        else:
-            self.replace_col_combo['values'] = []
+        elif self.replace_col_combo is not None:
+            self._set_combo_values(self.replace_col_combo, ())
             self.replace_col_btn.config(state="disabled")
             self.preview_col_btn.config(state="disabled")
             self.undo_col_btn.config(state="disabled")
 
     def preview_replace_column(self):
         # Show a preview of the first 10 rows as they would look after replacement
-        if not hasattr(self, 'secondary_work') or self.secondary_work is None:
+        if self._files_loading():
+            return
+        if self.secondary_work is None:
             messagebox.showwarning("No Data", "No processed target file available. Please process data first.")
             return
         col = self.replace_col_combo.get()
@@ -979,16 +1344,19 @@ class ExcelComparisonTool:
         if not col:
             messagebox.showwarning("No Column Selected", "Please select a column to preview.")
             return
-        preview_df = self.secondary_work.copy()
-        preview_df[col] = val
-        preview_rows = preview_df[[col]].head(10)
-        preview_text = preview_rows.to_string(index=True, header=True)
+        # Every row gets the same value, so only the first 10 index labels are needed
+        preview_labels = [str(label) for label in self.secondary_work.index[:10]]
+        width = max(map(len, preview_labels), default=0)
+        preview_text = "\n".join([f"{'':{width}}  {col}"] +
+                                 [f"{label:<{width}}  {val}" for label in preview_labels])
         messagebox.showinfo("Preview Replacement", f"Preview of column '{col}' after replacement (first 10 rows):\n\n{preview_text}")
         # self.log_message(f"Previewed replacement for column '{col}' with value '{val}'.", "INFO")
 
     def replace_entire_column(self):
         # Replace all values in the selected column with the specified value
-        if not hasattr(self, 'secondary_work') or self.secondary_work is None:
+        if self._files_loading():
+            return
+        if self.secondary_work is None:
             messagebox.showwarning("No Data", "No processed target file available. Please process data first.")
             return
         col = self.replace_col_combo.get()
@@ -1006,7 +1374,9 @@ class ExcelComparisonTool:
 
     def undo_replace_column(self):
         # Undo the last column replacement
-        if not hasattr(self, 'secondary_work') or self.secondary_work is None or self._undo_col_data is None or self._undo_col_name is None:
+        if self._files_loading():
+            return
+        if self.secondary_work is None or self._undo_col_data is None or self._undo_col_name is None:
             messagebox.showwarning("Nothing to Undo", "No column replacement to undo.")
             return
         self.secondary_work[self._undo_col_name] = self._undo_col_data
@@ -1025,227 +1395,306 @@ class ExcelComparisonTool:
 
     def on_data_source_selected(self, event=None):
         """Handle data source column selection - only one allowed"""
+        if self._files_loading():
+            return
         selected = self.ref_data_combo.get()
         if selected:
             self.selected_data_source.set(selected)
             self.data_source_label.config(text=selected)
-            self.update_mapping_display()
+            self._schedule_mapping_update()
             self.log_message(f"Data source column selected: {selected}")
 
     def on_reference_primary_selected(self, event=None):
         """Handle reference primary column selection"""
+        if self._files_loading():
+            return
         selected = self.ref_primary_combo.get()
         if selected:
             self.selected_reference_primary.set(selected)
             self.ref_primary_label.config(text=selected)
-            self.update_mapping_display()
+            self._schedule_mapping_update()
             self.log_message(f"Reference primary column selected: {selected}")
 
     def on_target_primary_selected(self, event=None):
         """Handle target primary column selection"""
+        if self._files_loading():
+            return
         selected = self.target_primary_combo.get()
-        if selected and selected not in self.selected_target_columns:
+        if selected and selected not in self._target_set:
+            self._target_set.add(selected)
             self.selected_target_columns.insert(0, selected)  # Insert at beginning as it's primary
             self.update_target_display()
-            self.update_mapping_display()
+            self._schedule_mapping_update()
             self.target_primary_combo.set("")  # Clear selection
             self.log_message(f"Target primary column selected: {selected}")
 
     def add_target_column(self):
         """Add additional target column for comparison"""
+        if self._files_loading():
+            return
         selected = self.target_additional_combo.get()
-        if selected and selected not in self.selected_target_columns:
+        if selected and selected not in self._target_set:
+            self._target_set.add(selected)
             self.selected_target_columns.append(selected)
             self.update_target_display()
-            self.update_mapping_display()
+            self._schedule_mapping_update()
             self.target_additional_combo.set("")  # Clear selection
             self.log_message(f"Additional target column added: {selected}")
 
     def add_replace_column(self):
         """Add column to replace list"""
+        if self._files_loading():
+            return
         selected = self.target_replace_combo.get()
-        if selected and selected not in self.selected_replace_columns:
+        if selected and selected not in self._replace_set:
+            self._replace_set.add(selected)
             self.selected_replace_columns.append(selected)
             self.update_replace_display()
-            self.update_mapping_display()
+            self._schedule_mapping_update()
             self.target_replace_combo.set("")  # Clear selection
             self.log_message(f"Replace column added: {selected}")
 
     def update_target_display(self):
         """Update target columns listbox"""
-        self.target_listbox.delete(0, tk.END)
+        lines = []
         for i, col in enumerate(self.selected_target_columns):
             display_text = f"{i+1}. {col}"
             if i == 0:
                 display_text += " (Primary)"
-            self.target_listbox.insert(tk.END, display_text)
+            lines.append(display_text)
+        self._sync_listbox(self.target_listbox, self._target_rendered, lines)
 
     def update_replace_display(self):
         """Update replace columns listbox"""
-        self.replace_listbox.delete(0, tk.END)
-        for i, col in enumerate(self.selected_replace_columns):
-            self.replace_listbox.insert(tk.END, f"{i+1}. {col}")
+        lines = [f"{i+1}. {col}" for i, col in enumerate(self.selected_replace_columns)]
+        self._sync_listbox(self.replace_listbox, self._replace_rendered, lines)
+
+    def _sync_listbox(self, listbox, rendered, lines):
+        """Make listbox show lines, rewriting only what follows the unchanged prefix; rendered is updated in place"""
+        prefix = 0
+        for old_line, new_line in zip(rendered, lines):
+            if old_line != new_line:
+                break
+            prefix += 1
+        if prefix < len(rendered):
+            listbox.delete(prefix, tk.END)
+        if prefix < len(lines):
+            listbox.insert(tk.END, *lines[prefix:])
+        rendered[:] = lines
+
+    def _schedule_mapping_update(self):
+        """Coalesce bursts of selection changes (e.g. auto-detect) into one mapping display rebuild"""
+        if not self._mapping_update_pending:
+            self._mapping_update_pending = True
+            self.root.after(30, self._run_mapping_update)
+
+    def _run_mapping_update(self):
+        self._mapping_update_pending = False
+        self.update_mapping_display()
 
     def update_mapping_display(self):
         """Update the mapping information display"""
-        self.mapping_info.config(state=tk.NORMAL)
-        self.mapping_info.delete(1.0, tk.END)
-        
-        mapping_text = ""
+        parts = []
         
         # Show individual target to replace mapping
         if self.selected_target_columns and self.selected_replace_columns:
-            mapping_text += "Individual Mapping:\n"
+            parts.append("Individual Mapping:\n")
             max_items = min(len(self.selected_target_columns), len(self.selected_replace_columns))
             for i in range(max_items):
                 # Show full column names instead of truncating
                 target = self.selected_target_columns[i]
                 replace = self.selected_replace_columns[i]
-                mapping_text += f"{i+1}. {target} →>> {replace}\n"
+                parts.append(f"{i+1}. {target} →>> {replace}\n")
             
             # Show unmapped items
             if len(self.selected_target_columns) > len(self.selected_replace_columns):
                 for i in range(len(self.selected_replace_columns), len(self.selected_target_columns)):
                     target = self.selected_target_columns[i]
-                    mapping_text += f"{i+1}. {target} →>> [No Replace]\n"
+                    parts.append(f"{i+1}. {target} →>> [No Replace]\n")
             elif len(self.selected_replace_columns) > len(self.selected_target_columns):
                 for i in range(len(self.selected_target_columns), len(self.selected_replace_columns)):
                     replace = self.selected_replace_columns[i]
-                    mapping_text += f"{i+1}. [No Target] →>> {replace}\n"
+                    parts.append(f"{i+1}. [No Target] →>> {replace}\n")
         
         # Show data source info
         data_source = self.selected_data_source.get()
         if data_source:
             data_short = data_source
-            mapping_text += f"\nData Source: {data_short}"
+            parts.append(f"\nData Source: {data_short}")
         
-        self.mapping_info.insert(1.0, mapping_text)
-        self.mapping_info.config(state=tk.DISABLED)
+        self._mapping_var.set("".join(parts).rstrip("\n"))
 
     def remove_target_from_listbox(self, event=None):
         """Remove selected target column via double-click"""
+        if self._files_loading():
+            return
         selection = self.target_listbox.curselection()
         if selection:
             index = selection[0]
             if index < len(self.selected_target_columns):
                 removed_col = self.selected_target_columns.pop(index)
+                self._target_set.discard(removed_col)
                 self.update_target_display()
-                self.update_mapping_display()
+                self._schedule_mapping_update()
                 self.log_message(f"Target column removed: {removed_col}")
 
     def remove_replace_from_listbox(self, event=None):
         """Remove selected replace column via double-click"""
+        if self._files_loading():
+            return
         selection = self.replace_listbox.curselection()
         if selection:
             index = selection[0]
             if index < len(self.selected_replace_columns):
                 removed_col = self.selected_replace_columns.pop(index)
+                self._replace_set.discard(removed_col)
                 self.update_replace_display()
-                self.update_mapping_display()
+                self._schedule_mapping_update()
                 self.log_message(f"Replace column removed: {removed_col}")
 
     def clear_all_selections(self):
         """Clear all column selections"""
+        if self._files_loading():
+            return
         self.selected_reference_primary.set("")
         self.selected_data_source.set("")
         self.ref_primary_label.config(text="None")
         self.data_source_label.config(text="None")
         self.selected_target_columns.clear()
         self.selected_replace_columns.clear()
+        self._target_set.clear()
+        self._replace_set.clear()
         
         self.update_target_display()
         self.update_replace_display()
-        self.update_mapping_display()
+        self._schedule_mapping_update()
         
         self.log_message("All selections cleared")
 
     def auto_detect_columns(self):
         """Auto-detect and suggest column mappings"""
+        if self._files_loading():
+            return
         if self.master_df is None or self.secondary_df is None:
             messagebox.showwarning("No Data", "Please load files first")
             return
         
-        # Clear existing selections
-        self.clear_all_selections()
+        # The selection handlers each log a line; report one summary instead
+        self._log_suspend_depth += 1
+        try:
+            # Clear existing selections
+            self.clear_all_selections()
         
-        # Auto-detect columns
-        master_cols = list(self.master_df.columns)
-        secondary_cols = list(self.secondary_df.columns)
+            # Auto-detect columns, lowercasing each name once
+            master_cols = [(col, str(col).lower()) for col in self._cols(self.master_df)]
+            secondary_cols = [(col, str(col).lower()) for col in self._cols(self.secondary_df)]
         
-        # Look for name columns in reference
-        name_keywords = ['name', 'naam', 'full name', 'fullname', 'participant']
-        for col in master_cols:
-            col_lower = col.lower()
-            for keyword in name_keywords:
-                if keyword in col_lower:
+            # Look for name columns in reference
+            for col, col_lower in master_cols:
+                if NAME_KEYWORDS_RE.search(col_lower):
                     self.ref_primary_combo.set(col)
                     self.on_reference_primary_selected()
-                    break
-            if self.selected_reference_primary.get():
-                break
+                    if self.selected_reference_primary.get():
+                        break
         
-        # Look for name columns in target
-        for col in secondary_cols:
-            col_lower = col.lower()
-            for keyword in name_keywords:
-                if keyword in col_lower:
+            # Look for name columns in target
+            for col, col_lower in secondary_cols:
+                if NAME_KEYWORDS_RE.search(col_lower):
                     self.target_primary_combo.set(col)
                     self.on_target_primary_selected()
-                    break
-            if self.selected_target_columns:
-                break
+                    if self.selected_target_columns:
+                        break
         
-        # Auto-add ID columns
-        id_keywords = ['id', 'signum', 'employee id', 'emp id', 'userid', 'user id']
-        
-        # Add ID from reference as data source
-        for col in master_cols:
-            col_lower = col.lower()
-            for keyword in id_keywords:
-                if keyword in col_lower:
+            # Add ID from reference as data source
+            for col, col_lower in master_cols:
+                if ID_KEYWORDS_RE.search(col_lower):
                     self.ref_data_combo.set(col)
                     self.on_data_source_selected()
-                    break
-            if self.selected_data_source.get():
-                break
+                    if self.selected_data_source.get():
+                        break
         
-        # Add ID from target to replace
-        for col in secondary_cols:
-            col_lower = col.lower()
-            for keyword in id_keywords:
-                if keyword in col_lower:
+            # Add ID from target to replace
+            for col, col_lower in secondary_cols:
+                if ID_KEYWORDS_RE.search(col_lower):
                     self.target_replace_combo.set(col)
                     self.add_replace_column()
-                    break
+        finally:
+            self._log_suspend_depth -= 1
         
+        self.log_message(
+            f"Auto-detect selected: ref={self.selected_reference_primary.get() or None}, "
+            f"target={self.selected_target_columns[0] if self.selected_target_columns else None}, "
+            f"data={self.selected_data_source.get() or None}, replace={self.selected_replace_columns}"
+        )
         self.log_message("Auto-detection completed")
 
     def update_column_dropdowns(self):
         """Update column dropdown menus with available columns"""
         if self.master_df is not None:
-            master_cols = list(self.master_df.columns)
-            self.ref_primary_combo['values'] = master_cols
-            self.ref_data_combo['values'] = master_cols
+            master_cols = self._cols(self.master_df)
+            self._set_combo_values(self.ref_primary_combo, master_cols)
+            self._set_combo_values(self.ref_data_combo, master_cols)
             
         if self.secondary_df is not None:
-            secondary_cols = list(self.secondary_df.columns)
-            self.target_primary_combo['values'] = secondary_cols
-            self.target_additional_combo['values'] = secondary_cols
-            self.target_replace_combo['values'] = secondary_cols
+            secondary_cols = self._cols(self.secondary_df)
+            self._set_combo_values(self.target_primary_combo, secondary_cols)
+            self._set_combo_values(self.target_additional_combo, secondary_cols)
+            self._set_combo_values(self.target_replace_combo, secondary_cols)
+
+    def _cols(self, df):
+        """Column names of df as a tuple, reused until df or its columns change"""
+        cached = self._cols_cache.get(id(df))
+        if cached is None or cached[0] is not df.columns:
+            cached = (df.columns, tuple(df.columns))
+            self._cols_cache[id(df)] = cached
+        return cached[1]
+
+    def _set_combo_values(self, combo, values):
+        """Set a combobox's values unless it already shows exactly these"""
+        if self._combo_values.get(str(combo)) != values:
+            combo['values'] = values
+            self._combo_values[str(combo)] = values
 
     def log_message(self, message, level="INFO"):
         """Add message to log(s) with timestamp"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {level}: {message}\n"
-        # Write to both logs if both exist, else to the one present
-        if hasattr(self, 'log_text') and self.log_text:
-            self.log_text.insert(tk.END, log_entry)
+        self.log_messages((message,), level)
+
+    def log_messages(self, messages, level="INFO"):
+        """Add several messages to the log(s) under one timestamp"""
+        # Inside a batch operation only warnings and errors get through
+        if self._log_suspend_depth and level not in ("WARNING", "ERROR"):
+            return
+        t = time.localtime()
+        prefix = f"[{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}] {level}: "
+        self._log_buffer.extend(f"{prefix}{message}\n" for message in messages)
+        # Worker threads leave the flush to the Tk thread (see _wait_for_futures)
+        if not self._log_flush_scheduled and threading.current_thread() is threading.main_thread():
+            self._log_flush_scheduled = True
+            self.root.after(50, self._flush_logs)
+
+    def _flush_logs(self):
+        """Write buffered log entries to the log in one insert"""
+        self._log_flush_scheduled = False
+        if not self._log_buffer or self.log_text_mapping is None:
+            return
+        # Load workers append concurrently: drain with popleft, which never drops
+        # or trips over a line added while the text is being gathered
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_buffer.popleft())
+        except IndexError:
+            pass
+        text = "".join(lines)
+        # log_text is a peer of log_text_mapping, so one insert shows up in both tabs
+        widget = self.log_text_mapping
+        widget.insert(tk.END, text)
+        # Drop the oldest lines so long runs don't grow the widget without bound
+        if int(widget.index('end-1c').split('.')[0]) > LOG_MAX_LINES:
+            widget.delete('1.0', f'end-{LOG_MAX_LINES} lines')
+        widget.see(tk.END)
+        if self.log_text is not None:
             self.log_text.see(tk.END)
-        if hasattr(self, 'log_text_mapping') and self.log_text_mapping:
-            self.log_text_mapping.insert(tk.END, log_entry)
-            self.log_text_mapping.see(tk.END)
-        self.root.update_idletasks()
         
     def browse_master_file(self):
         filename = filedialog.askopenfilename(
@@ -1271,10 +1720,21 @@ class ExcelComparisonTool:
             
     def load_files(self):
         """Load and analyze both Excel files"""
+        # The event loop keeps running while the loads are in flight
+        if self._loading:
+            return
+        self._loading = True
         try:
-            self.log_text.delete(1.0, tk.END)
+            self.log_text_mapping.delete(1.0, tk.END)
             self.log_message("Starting file loading process...")
             
+            # Copy-on-Write (the default from pandas 3) is switched on here, before the
+            # first DataFrame exists: process_data works on a shallow copy of the
+            # loaded secondary frame and relies on it to leave that frame untouched
+            pd = _pd()
+            if int(pd.__version__.split('.')[0]) < 3:
+                pd.options.mode.copy_on_write = True
+            
             # Validate file paths
             master_path = self.master_file_path.get().strip()
             secondary_path = self.secondary_file_path.get().strip()
@@ -1288,14 +1748,25 @@ class ExcelComparisonTool:
             if not os.path.exists(secondary_path):
                 raise FileNotFoundError(f"Secondary file not found: {secondary_path}")
             
-            # Load master file
-            self.log_message(f"Loading master file: {os.path.basename(master_path)}")
-            self.master_df = self.load_excel_file(master_path)
-            self.log_message(f"Master file loaded successfully. Shape: {self.master_df.shape}")
+            # Keep cached workbooks only for the two files being loaded
+            keep = {self.normalize_path(master_path), self.normalize_path(secondary_path)}
+            for cached_path in [p for p in self._wb_cache if p not in keep]:
+                self._close_workbook(cached_path)
             
-            # Load secondary file
+            # Load both files side by side; parsing mostly runs outside the GIL.
+            # The same file twice shares one cached workbook handle, so those
+            # loads run one after the other instead.
+            self.log_message(f"Loading master file: {os.path.basename(master_path)}")
             self.log_message(f"Loading secondary file: {os.path.basename(secondary_path)}")
-            self.secondary_df = self.load_excel_file(secondary_path)
+            self._cols_cache.clear()
+            with ThreadPoolExecutor(max_workers=1 if len(keep) == 1 else 2) as pool:
+                master_future = pool.submit(self.load_excel_file, master_path)
+                secondary_future = pool.submit(self.load_excel_file, secondary_path)
+                self._wait_for_futures(master_future, secondary_future)
+            
+            self.master_df = master_future.result()
+            self.log_message(f"Master file loaded successfully. Shape: {self.master_df.shape}")
+            self.secondary_df = secondary_future.result()
             self.log_message(f"Secondary file loaded successfully. Shape: {self.secondary_df.shape}")
             
             # Update column dropdowns
@@ -1307,13 +1778,63 @@ class ExcelComparisonTool:
             error_msg = f"Error loading files: {str(e)}"
             self.log_message(error_msg, "ERROR")
             messagebox.showerror("Error", error_msg)
+        finally:
+            self._loading = False
+    
+    def _files_loading(self):
+        """True (after telling the user) while load_files is still reading the workbooks"""
+        if self._loading:
+            messagebox.showinfo("Loading", "Files are still loading. Please wait until loading has finished.")
+            return True
+        return False
+    
+    def _wait_for_futures(self, *futures):
+        """Keep the Tk event loop and worker requests serviced until all futures are done"""
+        done = tk.BooleanVar(master=self.root, value=False)
+        
+        def poll():
+            while True:
+                try:
+                    call = self._main_calls.get_nowait()
+                except queue.Empty:
+                    break
+                call()
+            if self._log_buffer:
+                self._flush_logs()
+            if all(future.done() for future in futures):
+                done.set(True)
+            else:
+                self.root.after(20, poll)
+        
+        self.root.after(0, poll)
+        self.root.wait_variable(done)
+    
+    def _call_on_main(self, func, *args):
+        """Run func on the Tk thread and hand its result back to the calling worker"""
+        if threading.current_thread() is threading.main_thread():
+            return func(*args)
+        finished = threading.Event()
+        outcome = {}
+        
+        def run():
+            try:
+                outcome['value'] = func(*args)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                finished.set()
+        
+        self._main_calls.put(run)
+        finished.wait()
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('value')
             
     def is_valid_excel_file(self, filepath):
         """Check if file appears to be a valid Excel file"""
         try:
-            # Check file signature (magic numbers)
-            with open(filepath, 'rb') as f:
-                header = f.read(8)
+            # Check file signature (magic numbers), read once per file version
+            header = self._workbook_entry(filepath)[1]
                 
             # Excel file signatures
             xlsx_sig = b'PK\x03\x04'  # XLSX files are ZIP files
@@ -1327,29 +1848,43 @@ class ExcelComparisonTool:
             self.log_message(f"Error checking file validity: {str(e)}", "WARNING")
             return False
     
+    def _workbook_entry(self, filepath):
+        """Cache entry for filepath, dropped and rebuilt when the file changes on disk"""
+        mtime = os.stat(filepath).st_mtime_ns
+        entry = self._wb_cache.get(filepath)
+        if entry is not None and entry[0] != mtime:
+            self._close_workbook(filepath)
+            entry = None
+        if entry is None:
+            # Unbuffered: no 8 KiB read-ahead buffer for an 8-byte signature
+            with open(filepath, 'rb', buffering=0) as f:
+                header = os.pread(f.fileno(), 8, 0) if hasattr(os, 'pread') else f.read(8)
+            entry = (mtime, header, {})
+            self._wb_cache[filepath] = entry
+        return entry
+    
+    def _open_workbook(self, filepath, engine=None):
+        """Parsed pd.ExcelFile for filepath, reused across sheet listing and reads"""
+        books = self._workbook_entry(filepath)[2]
+        excel_file = books.get(engine)
+        if excel_file is None:
+            excel_file = _pd().ExcelFile(filepath, engine=engine)
+            books[engine] = excel_file
+        return excel_file
+    
+    def _close_workbook(self, filepath):
+        """Close and forget every cached workbook handle for filepath"""
+        entry = self._wb_cache.pop(filepath, None)
+        if entry is not None:
+            for excel_file in entry[2].values():
+                try:
+                    excel_file.close()
+                except Exception:
+                    pass
+    
     def load_excel_file(self, filepath):
         """Enhanced Excel file loader with enterprise support"""
         try:
-            # When running as a frozen executable, ensure all required modules are imported
-            if getattr(sys, 'frozen', False):
-                # Import all required modules at once to avoid issues
-                import pandas as pd
-                import numpy as np
-                import openpyxl
-                import xlrd
-                try:
-                    import pyxlsb
-                except ImportError:
-                    pass
-                try:
-                    import win32com.client
-                    import pythoncom
-                except ImportError:
-                    pass
-                
-                # Make pandas available globally
-                global pd
-            
             # Normalize file path to handle OneDrive paths better
             filepath = self.normalize_path(filepath)
             
@@ -1376,34 +1911,39 @@ class ExcelComparisonTool:
             # Second try: Use win32com if available (Windows only)
             if HAS_WIN32COM and platform.system() == 'Windows':
                 try:
-                    df = self.load_with_win32com(filepath, password)
+                    with self._com_lock:
+                        df = self.load_with_win32com(filepath, password)
                     if df is not None:
                         return df
                 except Exception as e:
                     self.log_message(f"COM interface loading failed: {str(e)}", "WARNING")
             
-            # Attempt to copy the file to a local temp location and try again
-            try:
-                self.log_message("Attempting to copy file to local temp location...", "INFO")
-                temp_file = self.copy_to_temp(filepath)
-                if temp_file:
-                    try:
-                        df = self.load_with_pandas(temp_file, password)
-                        if df is not None:
+            # Attempt to copy the file to a local temp location and try again; a local
+            # file would only fail the same way, so this is for synced/network paths
+            if _is_remote_path(filepath):
+                try:
+                    self.log_message("Attempting to copy file to local temp location...", "INFO")
+                    temp_file = self.copy_to_temp(filepath)
+                    if temp_file:
+                        try:
+                            df = self.load_with_pandas(temp_file, password)
+                            self._close_workbook(temp_file)
+                            if df is not None:
+                                # Clean up temp file
+                                try:
+                                    os.remove(temp_file)
+                                except:
+                                    pass
+                                return df
+                        except:
                             # Clean up temp file
+                            self._close_workbook(temp_file)
                             try:
                                 os.remove(temp_file)
                             except:
                                 pass
-                            return df
-                    except:
-                        # Clean up temp file
-                        try:
-                            os.remove(temp_file)
-                        except:
-                            pass
-            except Exception as e:
-                self.log_message(f"Temp file approach failed: {str(e)}", "WARNING")
+                except Exception as e:
+                    self.log_message(f"Temp file approach failed: {str(e)}", "WARNING")
             
             # If we get here, all methods failed
             raise ValueError("Failed to load Excel file with any method. The file might be corrupted, password-protected, or in an unsupported format.")
@@ -1473,9 +2013,9 @@ class ExcelComparisonTool:
             filename = os.path.basename(filepath)
             temp_file = os.path.join(temp_dir, f"temp_{int(time.time())}_{filename}")
             
-            # Copy the file
-            import shutil
-            shutil.copy2(filepath, temp_file)
+            # Only the bytes are needed: copyfile skips the metadata syscalls of copy2
+            # and uses the platform fast-copy path
+            shutil.copyfile(filepath, temp_file)
             
             self.log_message(f"File copied to temporary location: {temp_file}", "INFO")
             return temp_file
@@ -1488,15 +2028,11 @@ class ExcelComparisonTool:
         missing_deps = []
         
         # Check for odfpy
-        try:
-            import odf
-        except ImportError:
+        if not _module_available("odf"):
             missing_deps.append("odfpy")
         
         # Check for pyxlsb
-        try:
-            import pyxlsb
-        except ImportError:
+        if not _module_available("pyxlsb"):
             missing_deps.append("pyxlsb")
         
         # If there are missing dependencies, offer to install them
@@ -1513,8 +2049,7 @@ class ExcelComparisonTool:
             if response:
                 try:
                     self.log_message(f"Installing dependencies: {deps_str}", "INFO")
-                    for dep in missing_deps:
-                        subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
+                    subprocess.check_call([sys.executable, "-m", "pip", "install", *missing_deps])
                     self.log_message("Dependencies installed successfully", "INFO")
                     
                     # Inform user they may need to restart
@@ -1528,64 +2063,55 @@ class ExcelComparisonTool:
     
     def load_with_pandas(self, filepath, password=None):
         """Load Excel file using pandas with password support"""
-        # Ensure pandas is imported
-        if getattr(sys, 'frozen', False) and not 'pd' in globals():
-            global pd
-            import pandas as pd
-            
+        pd = _pd()
         file_ext = Path(filepath).suffix.lower()
         
         if file_ext in ['.xlsx', '.xls', '.xlsm', '.xlsb']:
             try:
                 # First try with default settings
                 engine = None
-                excel_kwargs = {}
                 
-                # Set engine based on file extension
-                if file_ext == '.xlsx' or file_ext == '.xlsm':
+                # Set engine based on file extension; the native calamine reader handles
+                # all of them when installed, the others remain as fallbacks below
+                if HAS_CALAMINE and _calamine() is not None:
+                    engine = 'calamine'
+                elif file_ext == '.xlsx' or file_ext == '.xlsm':
                     engine = 'openpyxl'
-                    # Ensure openpyxl is imported
-                    if getattr(sys, 'frozen', False):
-                        import openpyxl
                 elif file_ext == '.xls':
                     engine = 'xlrd'
-                    # Ensure xlrd is imported
-                    if getattr(sys, 'frozen', False):
-                        import xlrd
                 elif file_ext == '.xlsb':
                     engine = 'pyxlsb'
-                    # Ensure pyxlsb is imported
-                    if getattr(sys, 'frozen', False):
-                        try:
-                            import pyxlsb
-                        except ImportError:
-                            pass  # Optional dependency
                 
                 if engine:
-                    excel_kwargs['engine'] = engine
+                    # Ensure the engine module is imported
+                    _ENGINE_MODULES[engine]()
                 
                 # Handle password separately for openpyxl
-                if password and engine == 'openpyxl':
+                if password and file_ext in ('.xlsx', '.xlsm'):
                     # For openpyxl, we need to use a different approach
                     try:
-                        import openpyxl
+                        openpyxl = _openpyxl()
                         self.log_message("Loading password-protected file with openpyxl", "INFO")
-                        wb = openpyxl.load_workbook(filepath, data_only=True, password=password)
-                        sheet_names = wb.sheetnames
-                        
-                        if len(sheet_names) > 1:
-                            sheet_name = self.select_sheet(sheet_names, os.path.basename(filepath))
-                            if not sheet_name:
-                                raise ValueError("No sheet selected")
-                            ws = wb[sheet_name]
-                        else:
-                            ws = wb.active
-                        
-                        # Convert worksheet to dataframe preserving original data types
-                        data = ws.values
-                        cols = next(data)
-                        data = list(data)
-                        df = pd.DataFrame(data, columns=cols)
+                        # Streaming reader: rows come straight from the XML without building cell objects
+                        wb = openpyxl.load_workbook(filepath, data_only=True, read_only=True, keep_links=False, password=password)
+                        try:
+                            sheet_names = wb.sheetnames
+                            
+                            if len(sheet_names) > 1:
+                                sheet_name = self.select_sheet(sheet_names, os.path.basename(filepath))
+                                if not sheet_name:
+                                    raise ValueError("No sheet selected")
+                                ws = wb[sheet_name]
+                            else:
+                                ws = wb.active
+                            
+                            # Convert worksheet to dataframe preserving original data types
+                            rows_iter = ws.iter_rows(values_only=True)
+                            cols = next(rows_iter)
+                            df = pd.DataFrame.from_records(rows_iter, columns=cols)
+                        finally:
+                            # read_only mode keeps the zip archive open until closed
+                            wb.close()
                         
                         # Clean column names but preserve all data as-is
                         df.columns = df.columns.astype(str).str.strip()
@@ -1594,16 +2120,23 @@ class ExcelComparisonTool:
                     except ImportError:
                         self.log_message("openpyxl not available for password handling", "WARNING")
                 
-                # Standard approach without password - preserve data types
-                if len(pd.ExcelFile(filepath, **excel_kwargs).sheet_names) > 1:
-                    sheet_name = self.select_sheet(pd.ExcelFile(filepath, **excel_kwargs).sheet_names, os.path.basename(filepath))
-                    if not sheet_name:
-                        raise ValueError("No sheet selected")
-                    # Read without date parsing to preserve original formats
-                    df = pd.read_excel(filepath, sheet_name=sheet_name, dtype=str, **excel_kwargs)
-                else:
+                # Standard approach without password - preserve data types.
+                # One cached workbook serves both the sheet list and the read.
+                try:
+                    xl = self._open_workbook(filepath, engine)
+                    sheet_names = xl.sheet_names
+                    if len(sheet_names) > 1:
+                        sheet_name = self.select_sheet(sheet_names, os.path.basename(filepath))
+                        if not sheet_name:
+                            raise ValueError("No sheet selected")
+                    else:
+                        sheet_name = 0
                     # Read without date parsing to preserve original formats
-                    df = pd.read_excel(filepath, dtype=str, **excel_kwargs)
+                    df = pd.read_excel(xl, sheet_name=sheet_name, dtype=TEXT_DTYPE)
+                except Exception:
+                    # Don't keep a handle that failed to read
+                    self._close_workbook(filepath)
+                    raise
                 
                 # Clean column names but preserve data structure and formats
                 df.columns = df.columns.astype(str).str.strip()
@@ -1629,49 +2162,42 @@ class ExcelComparisonTool:
                 for engine in engines_to_try:
                     try:
                         self.log_message(f"Trying with engine: {engine}", "INFO")
-                        excel_kwargs = {'engine': engine}
                         
-                        # Ensure the engine module is imported
-                        if getattr(sys, 'frozen', False):
-                            if engine == 'openpyxl':
-                                import openpyxl
-                            elif engine == 'xlrd':
-                                import xlrd
-                            elif engine == 'pyxlsb':
-                                try:
-                                    import pyxlsb
-                                except ImportError:
-                                    continue  # Skip this engine if not available
-                            elif engine == 'odf':
-                                try:
-                                    import odf
-                                except ImportError:
-                                    continue  # Skip this engine if not available
+                        # Ensure the engine module is imported; skip engines that are not available
+                        if _ENGINE_MODULES[engine]() is None:
+                            continue
                         
-                        excel_file = pd.ExcelFile(filepath, **excel_kwargs)
+                        excel_file = self._open_workbook(filepath, engine)
                         sheet_names = excel_file.sheet_names
                         
                         if len(sheet_names) > 1:
                             sheet_name = self.select_sheet(sheet_names, os.path.basename(filepath))
                             if not sheet_name:
                                 raise ValueError("No sheet selected")
-                            # Preserve data types by reading as string
-                            df = pd.read_excel(filepath, sheet_name=sheet_name, dtype=str, **excel_kwargs)
                         else:
-                            # Preserve data types by reading as string
-                            df = pd.read_excel(filepath, dtype=str, **excel_kwargs)
+                            sheet_name = 0
+                        # Preserve data types by reading as string
+                        df = pd.read_excel(excel_file, sheet_name=sheet_name, dtype=TEXT_DTYPE)
                         
                         # Clean column names but preserve data
                         df.columns = df.columns.astype(str).str.strip()
                         # Don't remove empty rows - preserve structure
                         return df
                     except Exception as engine_error:
+                        self._close_workbook(filepath)
                         self.log_message(f"Engine {engine} failed: {str(engine_error)}", "WARNING")
                 
                 # All engines failed
                 raise ValueError("Failed to load with any pandas engine")
                 
         elif file_ext == '.csv':
+            # Native multi-threaded parser first when pyarrow is installed
+            if HAS_PYARROW and _pyarrow_csv() is not None:
+                try:
+                    return self.load_csv_with_pyarrow(filepath)
+                except Exception as e:
+                    self.log_message(f"pyarrow CSV reader failed, using pandas: {str(e)}", "WARNING")
+            
             # Try different encodings for CSV
             encodings = ['utf-8', 'latin1', 'cp1252', 'iso-8859-1']
             for encoding in encodings:
@@ -1687,20 +2213,46 @@ class ExcelComparisonTool:
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
     
+    def load_csv_with_pyarrow(self, filepath):
+        """Load a CSV with pyarrow's native reader, keeping every column as text"""
+        pd = _pd()
+        pa_csv = _pyarrow_csv()
+        import pyarrow as pa
+        
+        # Sniff the encoding from the start of the file rather than trial-parsing it
+        encoding = 'utf-8'
+        charset_normalizer = _charset_normalizer()
+        if charset_normalizer is not None:
+            with open(filepath, 'rb') as f:
+                best = charset_normalizer.from_bytes(f.read(64 * 1024)).best()
+            if best is not None:
+                encoding = best.encoding
+        
+        # Column names are needed up front to stop type inference (leading zeros etc.)
+        with open(filepath, newline='', encoding=encoding) as f:
+            header = next(csv.reader(f), None)
+        if not header or '' in header or len(set(header)) != len(header):
+            raise ValueError("blank or duplicate column names need pandas' header handling")
+        
+        table = pa_csv.read_csv(
+            filepath,
+            read_options=pa_csv.ReadOptions(encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=True
+            )
+        )
+        return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+    
     def load_with_win32com(self, filepath, password=None):
         """Load Excel file using COM interface (Windows only)"""
-        # Ensure pandas is imported
-        if getattr(sys, 'frozen', False) and not 'pd' in globals():
-            global pd
-            import pandas as pd
-            
+        pd = _pd()
         if not HAS_WIN32COM:
             raise ImportError("win32com not available")
         
-        # Ensure pythoncom is imported
-        if getattr(sys, 'frozen', False):
-            import pythoncom
-            import win32com.client
+        import pythoncom
+        import pywintypes
+        import win32com.client
             
         pythoncom.CoInitialize()
         try:
@@ -1744,37 +2296,51 @@ class ExcelComparisonTool:
                 else:
                     sheet = workbook.Sheets(1)
                 
-                # Save to a new format that pandas can read
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                
-                # Export data to CSV as an alternative approach
+                # Pull the cell grid in a single COM call (a tuple of row tuples)
+                df = None
                 try:
-                    # Try to export using SaveAs method
-                    sheet.Activate()
-                    # Try XlFileFormat.xlOpenXMLWorkbook (51) for XLSX
-                    workbook.SaveAs(temp_file, 51)
-                    workbook.Close(False)
-                    
-                    # Now load with pandas
-                    df = pd.read_excel(temp_file)
-                except Exception as e:
-                    self.log_message(f"SaveAs failed: {str(e)}", "WARNING")
-                    
-                    # Alternative approach - export to CSV
-                    csv_temp_file = temp_file.replace('.xlsx', '.csv')
-                    sheet.Activate()
-                    workbook.SaveAs(csv_temp_file, 6)  # 6 = CSV format
-                    workbook.Close(False)
-                    
-                    # Now load with pandas
-                    df = pd.read_csv(csv_temp_file)
+                    data = sheet.UsedRange.Value
+                    if data is not None:
+                        if not isinstance(data, tuple):
+                            # A single used cell comes back as a bare value
+                            data = ((data,),)
+                        df = pd.DataFrame(list(data[1:]), columns=[str(c).strip() for c in data[0]])
+                        workbook.Close(False)
+                except pywintypes.com_error as e:
+                    self.log_message(f"Reading UsedRange failed: {str(e)}", "WARNING")
+                
+                if df is None:
+                    # Save to a new format that pandas can read
+                    if os.path.exists(temp_file):
+                        os.remove(temp_file)
                     
-                    # Clean up CSV file
+                    # Export data to CSV as an alternative approach
                     try:
-                        os.remove(csv_temp_file)
-                    except:
-                        pass
+                        # Try to export using SaveAs method
+                        sheet.Activate()
+                        # Try XlFileFormat.xlOpenXMLWorkbook (51) for XLSX
+                        workbook.SaveAs(temp_file, 51)
+                        workbook.Close(False)
+                        
+                        # Now load with pandas
+                        df = pd.read_excel(temp_file)
+                    except Exception as e:
+                        self.log_message(f"SaveAs failed: {str(e)}", "WARNING")
+                        
+                        # Alternative approach - export to CSV
+                        csv_temp_file = temp_file.replace('.xlsx', '.csv')
+                        sheet.Activate()
+                        workbook.SaveAs(csv_temp_file, 6)  # 6 = CSV format
+                        workbook.Close(False)
+                        
+                        # Now load with pandas
+                        df = pd.read_csv(csv_temp_file)
+                        
+                        # Clean up CSV file
+                        try:
+                            os.remove(csv_temp_file)
+                        except:
+                            pass
                 
                 # Clean column names
                 df.columns = df.columns.astype(str).str.strip()
@@ -1802,6 +2368,9 @@ class ExcelComparisonTool:
 
     def prompt_for_password(self, filepath):
         """Prompt user for password if file might be password protected"""
+        if threading.current_thread() is not threading.main_thread():
+            # Files load on worker threads; dialogs must run on the Tk thread
+            return self._call_on_main(self.prompt_for_password, filepath)
         filename = os.path.basename(filepath)
         response = messagebox.askyesno(
             "Password Protected?", 
@@ -1819,6 +2388,9 @@ class ExcelComparisonTool:
     
     def select_sheet(self, sheet_names, filename):
         """Dialog to select sheet from multiple sheets"""
+        if threading.current_thread() is not threading.main_thread():
+            # Files load on worker threads; dialogs must run on the Tk thread
+            return self._call_on_main(self.select_sheet, sheet_names, filename)
         dialog = tk.Toplevel(self.root)
         dialog.title(f"Select Sheet - {filename}")
         dialog.geometry("300x200")
@@ -1857,31 +2429,11 @@ class ExcelComparisonTool:
         dialog.wait_window()
         return selected_sheet
         
-    def update_column_dropdowns(self):
-        """Update column dropdown menus with available columns"""
-        if self.master_df is not None:
-            master_cols = list(self.master_df.columns)
-            self.ref_primary_combo['values'] = master_cols
-            self.ref_data_combo['values'] = master_cols
-            
-        if self.secondary_df is not None:
-            secondary_cols = list(self.secondary_df.columns)
-            self.target_primary_combo['values'] = secondary_cols
-            self.target_additional_combo['values'] = secondary_cols
-            self.target_replace_combo['values'] = secondary_cols
-
-    def clean_name_series(self, series):
-        return (
-            series.astype(str)
-            .str.strip()
-            .str.replace(r'\s+', ' ', regex=True)
-            .str.lower()
-            .str.replace(r'[^\w\s\-]', '', regex=True)
-            .str.strip()  # Additional strip after cleaning
-        )
-
     def process_data(self):
         """Process and match data between files using advanced mapping"""
+        if self._files_loading():
+            return
+        pd = _pd()
         try:
             self.log_message("Starting advanced data processing...")
             
@@ -1897,7 +2449,13 @@ class ExcelComparisonTool:
             if not self.selected_target_columns:
                 raise ValueError("Please select at least one target column for comparison")
             
-            if self.preserve_structure.get() and not self.selected_replace_columns:
+            # Options are read once per run: each Tk variable get() is a round trip
+            # through the Tcl interpreter
+            preserve_structure = self.preserve_structure.get()
+            multivalue_on = self.enable_multivalue.get()
+            fuzzy_on = self.fuzzy_matching.get()
+            
+            if preserve_structure and not self.selected_replace_columns:
                 raise ValueError("Please select columns to replace when preserve structure is enabled")
             
             data_source = self.selected_data_source.get()
@@ -1909,174 +2467,297 @@ class ExcelComparisonTool:
             self.log_message(f"Replace columns: {self.selected_replace_columns}")
             self.log_message(f"Data source column: {data_source}")
             
-            if self.enable_multivalue.get():
+            if multivalue_on:
                 delimiter = self.target_delimiter.get()
                 self.log_message(f"Multi-value processing enabled with delimiter: '{delimiter}'")
             
-            # Create working copies
-            master_work = self.master_df.copy()
-            self.secondary_work = self.secondary_df.copy()
+            # Shallow working copy: copy-on-write keeps the loaded DataFrame
+            # untouched without a full deep copy
+            self._cols_cache.clear()
+            self.secondary_work = self.secondary_df.copy(deep=False)
             
-            # Clean names for comparison (vectorized)
-            master_work['clean_reference'] = self.clean_name_series(master_work[reference_primary])
-            
-            # Clean target columns for comparison (vectorized)
-            for i, target_col in enumerate(self.selected_target_columns):
-                self.secondary_work[f'clean_target_{i}'] = self.clean_name_series(self.secondary_work[target_col])
+            # Cleaned match keys (vectorized) stay beside the frames, never added as columns
+            master_clean = clean_name_series(self.master_df[reference_primary])
+            cleaned_targets = pd.concat(
+                [clean_name_series(self.secondary_df[target_col]).rename(f'clean_target_{i}')
+                 for i, target_col in enumerate(self.selected_target_columns)],
+                axis=1
+            )
             
             # Statistics
             exact_matches = 0
             fuzzy_matches = 0
             no_matches = 0
             
-            if self.preserve_structure.get():
-                # Add tracking columns
-                self.secondary_work['Match_Type'] = ""
-                self.secondary_work['Matched_Reference_Name'] = ""
-                self.secondary_work['Confidence'] = ""
-                self.secondary_work['Matched_Column'] = ""
+            if preserve_structure:
+                np = _np()
+                # Tracking columns are collected per row and assigned once
+                row_count = len(self.secondary_work)
+                match_type_values = np.full(row_count, "", dtype=object)
+                matched_name_values = np.full(row_count, "", dtype=object)
+                confidence_values = np.full(row_count, "", dtype=object)
+                matched_column_values = np.full(row_count, "", dtype=object)
                 
                 # Process each row in secondary file
                 self.log_message(f"Processing {len(self.secondary_work)} records from target file...")
                 
-                for idx, row in self.secondary_work.iterrows():
+                # Raw and cleaned target cells as plain arrays, indexed by row position
+                target_arrays = [self.secondary_work[col].to_numpy(dtype=object) for col in self.selected_target_columns]
+                clean_arrays = [cleaned_targets[f'clean_target_{i}'].to_numpy(dtype=object)
+                                for i in range(len(self.selected_target_columns))]
+                
+                # Exact matches for every target column come from one hash join
+                # each; keeping the first master row per key mirrors iloc[0]
+                master_lookup = pd.DataFrame({
+                    'clean_reference': master_clean,
+                    'matched_name': self.master_df[reference_primary],
+                    'data_value': self.master_df[data_source] if data_source in self.master_df.columns else "",
+                }).drop_duplicates('clean_reference')
+                exact_lookups = []
+                for i in range(len(self.selected_target_columns)):
+                    joined = cleaned_targets[[f'clean_target_{i}']].merge(
+                        master_lookup, how='left',
+                        left_on=f'clean_target_{i}', right_on='clean_reference'
+                    )
+                    exact_lookups.append((
+                        joined['clean_reference'].notna().to_numpy(),
+                        joined['matched_name'].to_numpy(dtype=object),
+                        joined['data_value'].to_numpy(dtype=object)
+                    ))
+                
+                # Fuzzy candidates and cleaned key -> (matched name, data value), built once for all rows
+                master_dict = dict(zip(
+                    master_lookup['clean_reference'],
+                    zip(master_lookup['matched_name'], master_lookup['data_value'])
+                ))
+                master_names = list(master_dict)
+                self._match_cache = {}
+                self._window_cache = OrderedDict()
+                self._match_threshold = self.similarity_threshold.get()
+                self._match_fuzzy = fuzzy_on
+                
+                # Settle whole columns at once: exact hits and cells with nothing to match.
+                # A row goes through the loop below only if one of its cells may be
+                # multi-value or needs a fuzzy lookup.
+                needs_loop = np.zeros(row_count, dtype=bool)
+                exact_masks = []
+                fuzzy_queries = []
+                # Per target column: tokens of its multi-value cells (None if there are none)
+                token_frames = []
+                for i, target_col in enumerate(self.selected_target_columns):
+                    raw = self.secondary_work[target_col]
+                    raw_text = raw.astype(str)
+                    present = (raw.notna() & raw_text.str.strip().ne("")).to_numpy(dtype=bool)
+                    has_clean = cleaned_targets[f'clean_target_{i}'].ne("").to_numpy(dtype=bool)
+                    exact_hit = exact_lookups[i][0]
+                    if multivalue_on:
+                        # The first delimiter present wins, in the order comma, semicolon, pipe
+                        delimiters = np.select(
+                            [raw_text.str.contains(delim, regex=False).to_numpy(dtype=bool) for delim in COMMON_DELIMITERS],
+                            COMMON_DELIMITERS,
+                            default=''
+                        )
+                        maybe_multi = present & (delimiters != '')
+                    else:
+                        maybe_multi = np.zeros(row_count, dtype=bool)
+                    tokens = None
+                    if maybe_multi.any():
+                        # All tokens of the column split, cleaned and probed at once
+                        tokens = split_multivalue_cells(raw_text.to_numpy(dtype=object), delimiters, maybe_multi)
+                        if fuzzy_on:
+                            token_clean = tokens['clean']
+                            fuzzy_queries.extend(token_clean[token_clean.ne("") & ~token_clean.isin(master_names)])
+                    token_frames.append(tokens)
+                    exact_masks.append(present & has_clean & exact_hit & ~maybe_multi)
+                    needs_loop |= maybe_multi
+                    if fuzzy_on:
+                        fuzzy_mask = present & has_clean & ~exact_hit
+                        needs_loop |= fuzzy_mask
+                        fuzzy_queries.extend(clean_arrays[i][fuzzy_mask])
+                
+                # Fuzzy scoring dominates the run time; do it for all distinct names up front
+                if fuzzy_queries and master_names:
+                    self._prefill_match_cache(fuzzy_queries, master_names)
+                
+                # Multi-value cells per target column: position -> (delimiter, tokens, token matches)
+                multi_cells = [{} for _ in self.selected_target_columns]
+                for i, tokens in enumerate(token_frames):
+                    if tokens is None:
+                        continue
+                    cells = multi_cells[i]
+                    for pos, delim, token, token_clean in zip(
+                        tokens.index.tolist(), tokens['delimiter'], tokens['token'], tokens['clean']
+                    ):
+                        if pos not in cells:
+                            cells[pos] = (delim, [], [])
+                        cells[pos][1].append(token)
+                        cells[pos][2].append(self._match_clean_name(token_clean, master_names, master_dict))
+                
+                # Replace-column results are gathered per target column and written once
+                # after the loop; target column i feeds replace column i
+                replace_updates = {
+                    i: (replace_col, np.zeros(row_count, dtype=bool), np.empty(row_count, dtype=object))
+                    for i, replace_col in enumerate(self.selected_replace_columns[:len(self.selected_target_columns)])
+                    if replace_col in self.secondary_work.columns
+                }
+                
+                settled = ~needs_loop
+                match_type_values[settled] = "REVIEW"
+                settled_exact = np.zeros(row_count, dtype=bool)
+                # Lowest target column wins among equal (1.0) confidences, as max() did
+                for i in reversed(range(len(self.selected_target_columns))):
+                    mask = exact_masks[i] & settled
+                    if not mask.any():
+                        continue
+                    settled_exact |= mask
+                    match_type_values[mask] = "EXACT"
+                    matched_name_values[mask] = exact_lookups[i][1][mask]
+                    confidence_values[mask] = 1.0
+                    matched_column_values[mask] = self.selected_target_columns[i]
+                    if i in replace_updates:
+                        _, written, new_values = replace_updates[i]
+                        written |= mask
+                        new_values[mask] = exact_lookups[i][2][mask]
+                exact_matches += int(settled_exact.sum())
+                no_matches += int(settled.sum() - settled_exact.sum())
+                
+                if len(self.selected_target_columns) == 1 and not multivalue_on and needs_loop.any():
+                    # One single-valued target column: every row left is a plain fuzzy
+                    # lookup, so settle them all from the prefilled cache instead of the loop
+                    fuzzy_rows = np.flatnonzero(needs_loop)
+                    found = pd.Series(clean_arrays[0][fuzzy_rows], dtype=object).map(self._match_cache)
+                    hit = found.notna().to_numpy(dtype=bool)
+                    matched_rows = fuzzy_rows[hit]
+                    match_type_values[fuzzy_rows] = "REVIEW"
+                    if hit.any():
+                        matched_keys, scores = zip(*found[hit])
+                        matched = master_lookup.set_index('clean_reference').reindex(list(matched_keys))
+                        match_type_values[matched_rows] = "FUZZY"
+                        matched_name_values[matched_rows] = matched['matched_name'].to_numpy(dtype=object)
+                        confidence_values[matched_rows] = [round(score, 3) for score in scores]
+                        matched_column_values[matched_rows] = self.selected_target_columns[0]
+                        if 0 in replace_updates:
+                            _, written, new_values = replace_updates[0]
+                            written[matched_rows] = True
+                            new_values[matched_rows] = matched['data_value'].to_numpy(dtype=object)
+                    fuzzy_matches += len(matched_rows)
+                    no_matches += len(fuzzy_rows) - len(matched_rows)
+                    needs_loop[:] = False
+                
+                # Multi-value details, passed to the log in batches rather than per token
+                match_log = []
+                for pos in np.flatnonzero(needs_loop):
+                    if len(match_log) >= LOG_BATCH_LINES:
+                        self.log_messages(match_log)
+                        match_log.clear()
+                    
                     # Track matches for each target column individually
                     matches_found = {}  # target_column_index -> (match_info, data_source_value)
+                    best_match = None
                     
                     # Check each target column against reference primary
                     for i, target_col in enumerate(self.selected_target_columns):
-                        target_value = row[target_col]
+                        target_value = target_arrays[i][pos]
                         
                         if pd.isna(target_value) or str(target_value).strip() == "":
                             continue
                         
                         # Handle multi-value processing if enabled
-                        if self.enable_multivalue.get():
-                            # Check if the value contains any delimiters (comma, semicolon, pipe)
-                            target_str = str(target_value)
-                            delimiters_to_check = [',', ';', '|']
-                            actual_delimiter = None
+                        # Multi-value cells had their tokens split and matched in bulk above
+                        multi_cell = multi_cells[i].get(pos) if multivalue_on else None
+                        if multi_cell is not None:
+                            actual_delimiter, target_values, token_matches = multi_cell
+                            match_log.append(f"Processing multi-value field with delimiter '{actual_delimiter}': {target_values}")
                             
-                            # Find which delimiter is actually used in this value
-                            for delim in delimiters_to_check:
-                                if delim in target_str:
-                                    actual_delimiter = delim
-                                    break
+                            # Process multiple values
+                            matched_results = []
+                            match_types = []
+                            for target_val, match_result in zip(target_values, token_matches):
+                                if match_result:
+                                    matched_results.append(match_result['data_value'])
+                                    match_types.append(match_result['type'])
+                                    match_log.append(f"  '{target_val}' matched to '{match_result['data_value']}'")
+                                else:
+                                    matched_results.append("match unfound")
+                                    match_types.append("NONE")
+                                    match_log.append(f"  '{target_val}' not matched")
+                            
+                            # Use the same delimiter that was found in the original data, with proper spacing
+                            if actual_delimiter == ',':
+                                combined_data_value = ', '.join(matched_results)  # Add space after comma
+                            elif actual_delimiter == ';':
+                                combined_data_value = '; '.join(matched_results)  # Add space after semicolon
+                            else:
+                                combined_data_value = actual_delimiter.join(matched_results)  # Keep original for other delimiters
+                            
+                            # Determine overall match type
+                            has_exact = "EXACT" in match_types
+                            has_fuzzy = "FUZZY" in match_types
+                            match_count = len([r for r in matched_results if r != 'match unfound'])
+                            
+                            match_type = "EXACT" if has_exact else ("FUZZY" if has_fuzzy else "REVIEW")
                             
-                            # Process multi-value if we found a delimiter
-                            if actual_delimiter:
-                                # Clean each value by stripping spaces before and after delimiter
-                                target_values = []
-                                for val in target_str.split(actual_delimiter):
-                                    cleaned_val = val.strip()
-                                    if cleaned_val:  # Only add non-empty values
-                                        target_values.append(cleaned_val)
-                                
-                                if len(target_values) > 1:
-                                    self.log_message(f"Processing multi-value field with delimiter '{actual_delimiter}': {target_values}")
-                                    
-                                    # Process multiple values
-                                    matched_results = []
-                                    match_types = []
-                                    for target_val in target_values:
-                                        # Additional cleaning to ensure no spaces affect matching
-                                        target_val = target_val.strip()
-                                        match_result = self.find_match_for_value(target_val, master_work, reference_primary, data_source)
-                                        if match_result:
-                                            matched_results.append(match_result['data_value'])
-                                            match_types.append(match_result['type'])
-                                            self.log_message(f"  '{target_val}' matched to '{match_result['data_value']}'")
-                                        else:
-                                            matched_results.append("match unfound")
-                                            match_types.append("NONE")
-                                            self.log_message(f"  '{target_val}' not matched")
-                                    
-                                    if matched_results:
-                                        # Use the same delimiter that was found in the original data, with proper spacing
-                                        if actual_delimiter == ',':
-                                            combined_data_value = ', '.join(matched_results)  # Add space after comma
-                                        elif actual_delimiter == ';':
-                                            combined_data_value = '; '.join(matched_results)  # Add space after semicolon
-                                        else:
-                                            combined_data_value = actual_delimiter.join(matched_results)  # Keep original for other delimiters
-                                        
-                                        # Determine overall match type
-                                        has_exact = "EXACT" in match_types
-                                        has_fuzzy = "FUZZY" in match_types
-                                        match_count = len([r for r in matched_results if r != 'match unfound'])
-                                        
-                                        match_type = "EXACT" if has_exact else ("FUZZY" if has_fuzzy else "REVIEW")
-                                        
-                                        matches_found[i] = {
-                                            'type': match_type,
-                                            'matched_name': f"Multi-value: {match_count}/{len(target_values)} matched",
-                                            'confidence': 1.0 if has_exact else (0.8 if has_fuzzy else 0.0),
-                                            'column': target_col,
-                                            'data_value': combined_data_value
-                                        }
-                                        continue
-                        
-                        # Single value processing (original logic)
-                        target_clean_name = self.clean_name(target_value)
-                        if not target_clean_name:
-                            continue
-                        
-                        # Try exact match
-                        exact_match = master_work[master_work['clean_reference'] == target_clean_name]
-                        
-                        if not exact_match.empty:
                             matches_found[i] = {
-                                'type': 'EXACT',
-                                'matched_name': exact_match.iloc[0][reference_primary],
-                                'confidence': 1.0,
+                                'type': match_type,
+                                'matched_name': f"Multi-value: {match_count}/{len(target_values)} matched",
+                                'confidence': 1.0 if has_exact else (0.8 if has_fuzzy else 0.0),
                                 'column': target_col,
-                                'data_value': exact_match.iloc[0].get(data_source, "")
+                                'data_value': combined_data_value
                             }
                         
-                        # Try fuzzy matching if enabled and no exact match
-                        elif self.fuzzy_matching.get():
-                            master_names = master_work['clean_reference'].dropna().tolist()
-                            if master_names:
-                                close_matches = get_close_matches(
-                                    target_clean_name,
-                                    master_names,
-                                    n=1,
-                                    cutoff=self.similarity_threshold.get()
-                                )
-                                
-                                if close_matches:
-                                    matched_clean_name = close_matches[0]
-                                    fuzzy_match = master_work[master_work['clean_reference'] == matched_clean_name]
+                        else:
+                            # Single value processing (original logic)
+                            target_clean_name = clean_arrays[i][pos]
+                            if not target_clean_name:
+                                continue
+                            
+                            # Exact match from the precomputed join
+                            exact_hit, exact_names, exact_values = exact_lookups[i]
+                            
+                            if exact_hit[pos]:
+                                matches_found[i] = {
+                                    'type': 'EXACT',
+                                    'matched_name': exact_names[pos],
+                                    'confidence': 1.0,
+                                    'column': target_col,
+                                    'data_value': exact_values[pos]
+                                }
+                            
+                            # Try fuzzy matching if enabled and no exact match
+                            elif fuzzy_on:
+                                if master_names:
+                                    close_match = self._closest_master_name(target_clean_name, master_names)
                                     
-                                    if not fuzzy_match.empty:
-                                        from difflib import SequenceMatcher
-                                        confidence = SequenceMatcher(None, target_clean_name, matched_clean_name).ratio()
-                                        
+                                    if close_match:
+                                        matched_clean_name, confidence = close_match
+                                        matched_name, data_value = master_dict[matched_clean_name]
                                         matches_found[i] = {
                                             'type': 'FUZZY',
-                                            'matched_name': fuzzy_match.iloc[0][reference_primary],
+                                            'matched_name': matched_name,
                                             'confidence': confidence,
                                             'column': target_col,
-                                            'data_value': fuzzy_match.iloc[0].get(data_source, "")
+                                            'data_value': data_value
                                         }
+                        
+                        # Keep the first highest-confidence match as the row's best
+                        match_info = matches_found.get(i)
+                        if match_info is not None and (best_match is None or match_info['confidence'] > best_match['confidence']):
+                            best_match = match_info
                     
                     # Update replace columns based on individual matchess
                     if matches_found:
                         # Update each replace column based on its corresponding target column
                         for target_idx, match_info in matches_found.items():
-                            if target_idx < len(self.selected_replace_columns):
-                                replace_col = self.selected_replace_columns[target_idx]
-                                if replace_col in self.secondary_work.columns:
-                                    self.secondary_work.at[idx, replace_col] = match_info['data_value']
-                        
-                        # Use the best match for tracking (highest confidence)
-                        best_match = max(matches_found.values(), key=lambda x: x['confidence'])
+                            if target_idx in replace_updates:
+                                _, written, new_values = replace_updates[target_idx]
+                                written[pos] = True
+                                new_values[pos] = match_info['data_value']
                         
                         # Update tracking with best match
-                        self.secondary_work.at[idx, 'Match_Type'] = best_match['type']
-                        self.secondary_work.at[idx, 'Matched_Reference_Name'] = best_match['matched_name']
-                        self.secondary_work.at[idx, 'Confidence'] = round(best_match['confidence'], 3)
-                        self.secondary_work.at[idx, 'Matched_Column'] = best_match['column']
+                        match_type_values[pos] = best_match['type']
+                        matched_name_values[pos] = best_match['matched_name']
+                        confidence_values[pos] = round(best_match['confidence'], 3)
+                        matched_column_values[pos] = best_match['column']
                         
                         if best_match['type'] == "EXACT":
                             exact_matches += 1
@@ -2084,12 +2765,23 @@ class ExcelComparisonTool:
                             fuzzy_matches += 1
                     else:
                         no_matches += 1
-                        self.secondary_work.at[idx, 'Match_Type'] = "REVIEW"
+                        match_type_values[pos] = "REVIEW"
+                
+                if match_log:
+                    self.log_messages(match_log)
+                
+                # In target column order, so a replace column shared by several targets
+                # ends up with the last target's match as before
+                for replace_col, written, new_values in replace_updates.values():
+                    if written.any():
+                        self.secondary_work.loc[written, replace_col] = new_values[written]
                 
-                # Clean up temporary columns
-                cols_to_drop = ['clean_reference'] + [f'clean_target_{i}' for i in range(len(self.selected_target_columns))]
-                master_work = master_work.drop(columns=[col for col in cols_to_drop if col in master_work.columns])
-                self.secondary_work = self.secondary_work.drop(columns=[col for col in cols_to_drop if col in self.secondary_work.columns])
+                self.secondary_work = self.secondary_work.assign(
+                    Match_Type=match_type_values,
+                    Matched_Reference_Name=matched_name_values,
+                    Confidence=confidence_values,
+                    Matched_Column=matched_column_values
+                )
             
             # Log statistics
             total_records = len(self.secondary_work)
@@ -2112,13 +2804,14 @@ class ExcelComparisonTool:
 
     def show_advanced_results_preview(self):
         """Show preview of advanced results in log"""
+        pd = _pd()
         if not self.selected_target_columns:
             return
         
         primary_target_col = self.selected_target_columns[0]
         self.log_message("\n--- ADVANCED RESULTS PREVIEW ---")
         
-        if self.preserve_structure.get() and hasattr(self, 'secondary_work'):
+        if self.preserve_structure.get() and self.secondary_work is not None:
             # Preview from updated secondary dataframe
             preview_df = self.secondary_work[self.secondary_work[primary_target_col].notna() & 
                                            (self.secondary_work[primary_target_col].astype(str).str.strip() != "")].head(10)
@@ -2154,23 +2847,14 @@ class ExcelComparisonTool:
             if non_empty_count > 10:
                 self.log_message(f"... and {non_empty_count - 10} more records")
 
-    def clean_name(self, name):
-        """Clean and normalize name for comparison"""
-        if pd.isna(name) or name is None:
-            return ""
-        
-        name = str(name).strip()
-        # Remove extra spaces and convert to lowercase
-        name = re.sub(r'\s+', ' ', name).lower()
-        # Remove special characters except spaces and hyphens
-        name = re.sub(r'[^\w\s\-]', '', name)
-        return name.strip()  # Final strip to ensure no leading/trailing spaces
-
     def export_results(self):
         """Export results to Excel file"""
+        if self._files_loading():
+            return
+        pd = _pd()
         try:
-            if (self.preserve_structure.get() and not hasattr(self, 'secondary_work')) or \
-               (not self.preserve_structure.get() and not hasattr(self, 'result_df')):
+            if (self.preserve_structure.get() and self.secondary_work is None) or \
+               (not self.preserve_structure.get() and self.result_df is None):
                 messagebox.showwarning("No Results", "No results to export. Please process data first.")
                 return
                 
@@ -2196,26 +2880,17 @@ class ExcelComparisonTool:
                         export_df = export_df.drop(columns=['clean_name'])
                     
                     if file_ext == '.xlsx':
-                        # Use openpyxl to preserve formatting better
-                        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                        with self._excel_writer(filename) as writer:
                             export_df.to_excel(writer, sheet_name='Results', index=False)
                             
-                            # Get the workbook and worksheet
-                            workbook = writer.book
+                            # Auto-adjust column widths from the data, one vectorized pass per column
                             worksheet = writer.sheets['Results']
-                            
-                            # Auto-adjust column widths
-                            for column in worksheet.columns:
-                                max_length = 0
-                                column_letter = column[0].column_letter
-                                for cell in column:
-                                    try:
-                                        if len(str(cell.value)) > max_length:
-                                            max_length = len(str(cell.value))
-                                    except:
-                                        pass
-                                adjusted_width = min(max_length + 2, 50)
-                                worksheet.column_dimensions[column_letter].width = adjusted_width
+                            for col_idx, width in enumerate(excel_column_widths(export_df)):
+                                if writer.engine == 'xlsxwriter':
+                                    worksheet.set_column(col_idx, col_idx, width)
+                                else:
+                                    from openpyxl.utils import get_column_letter
+                                    worksheet.column_dimensions[get_column_letter(col_idx + 1)].width = width
                         
                     elif file_ext == '.csv':
                         export_df.to_csv(filename, index=False)
@@ -2226,7 +2901,7 @@ class ExcelComparisonTool:
                     # Original export behavior with multiple sheets
                     if file_ext == '.xlsx':
                         # Create Excel file with multiple sheets
-                        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                        with self._excel_writer(filename) as writer:
                             # Main results
                             self.result_df.to_excel(writer, sheet_name='Results', index=False)
                             
@@ -2262,56 +2937,90 @@ class ExcelComparisonTool:
             self.log_message(error_msg, "ERROR")
             messagebox.showerror("Export Error", error_msg)
 
-    def find_match_for_value(self, target_value, master_work, reference_primary, data_source, exact_only=False, fuzzy_only=False):
-        """Find match for a single target value"""
-        target_clean_name = self.clean_name(target_value)
+    def _excel_writer(self, filename):
+        """ExcelWriter for exports: XlsxWriter when installed, openpyxl otherwise"""
+        pd = _pd()
+        # constant_memory is left off: pandas writes cells column by column and
+        # XlsxWriter's streaming mode drops anything written to an earlier row
+        return pd.ExcelWriter(filename, engine='xlsxwriter' if HAS_XLSXWRITER else 'openpyxl')
+    
+    def _prefill_match_cache(self, queries, master_names):
+        """Score distinct queries into _match_cache, in batches or across a process pool when there are many"""
+        queries = [query for query in dict.fromkeys(queries) if query not in self._match_cache]
+        if closest_matches is not None:
+            # RapidFuzz: one cdist per length window, threaded natively without the GIL
+            groups = {}
+            for query in queries:
+                candidates = windowed_choices(master_names, query, self._match_threshold, self._window_cache)
+                groups.setdefault(id(candidates), (candidates, []))[1].append(query)
+            for candidates, group in groups.values():
+                self._match_cache.update(zip(group, closest_matches(group, candidates, self._match_threshold)))
+            return
+        
+        workers = min(os.cpu_count() or 1, 8)
+        if len(queries) < PARALLEL_MATCH_MIN or workers < 2:
+            for query in queries:
+                self._closest_master_name(query, master_names)
+            return
+        
+        self.log_message(f"Fuzzy matching {len(queries)} distinct values on {workers} processes...")
+        chunk_size = -(-len(queries) // (workers * 4))
+        chunks = [queries[start:start + chunk_size] for start in range(0, len(queries), chunk_size)]
+        # spawn: forking a process that runs Tk is unsafe, and it is the only option on Windows
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_match_worker,
+            initargs=(master_names, self._match_threshold)
+        ) as pool:
+            for chunk, results in zip(chunks, pool.map(_match_worker, chunks)):
+                self._match_cache.update(zip(chunk, results))
+    
+    def _closest_master_name(self, target_clean_name, master_names):
+        """closest_match against master_names, memoized per processing run since target values repeat"""
+        if target_clean_name not in self._match_cache:
+            candidates = windowed_choices(master_names, target_clean_name, self._match_threshold, self._window_cache)
+            self._match_cache[target_clean_name] = closest_match(
+                target_clean_name, candidates, self._match_threshold
+            )
+        return self._match_cache[target_clean_name]
+
+    def _match_clean_name(self, target_clean_name, master_names, master_dict):
+        """Find match for one cleaned target name against the master_names/master_dict built in process_data"""
         if not target_clean_name:
             return None
         
         # Try exact match
-        if not fuzzy_only:
-            exact_match = master_work[master_work['clean_reference'] == target_clean_name]
-            if not exact_match.empty:
-                return {
-                    'type': 'EXACT',
-                    'matched_name': exact_match.iloc[0][reference_primary],
-                    'confidence': 1.0,
-                    'data_value': exact_match.iloc[0].get(data_source, "")
-                }
+        exact_match = master_dict.get(target_clean_name)
+        if exact_match is not None:
+            return {
+                'type': 'EXACT',
+                'matched_name': exact_match[0],
+                'confidence': 1.0,
+                'data_value': exact_match[1]
+            }
         
         # Try fuzzy matching if enabled and no exact match
-        if not exact_only and self.fuzzy_matching.get():
-            master_names = master_work['clean_reference'].dropna().tolist()
-            if master_names:
-                close_matches = get_close_matches(
-                    target_clean_name,
-                    master_names,
-                    n=1,
-                    cutoff=self.similarity_threshold.get()
-                )
-                
-                if close_matches:
-                    matched_clean_name = close_matches[0]
-                    fuzzy_match = master_work[master_work['clean_reference'] == matched_clean_name]
-                    
-                    if not fuzzy_match.empty:
-                        from difflib import SequenceMatcher
-                        confidence = SequenceMatcher(None, target_clean_name, matched_clean_name).ratio()
-                        
-                        return {
-                            'type': 'FUZZY',
-                            'matched_name': fuzzy_match.iloc[0][reference_primary],
-                            'confidence': confidence,
-                            'data_value': fuzzy_match.iloc[0].get(data_source, "")
-                        }
+        if self._match_fuzzy and master_names:
+            close_match = self._closest_master_name(target_clean_name, master_names)
+            
+            if close_match:
+                matched_clean_name, confidence = close_match
+                matched_name, data_value = master_dict[matched_clean_name]
+                return {
+                    'type': 'FUZZY',
+                    'matched_name': matched_name,
+                    'confidence': confidence,
+                    'data_value': data_value
+                }
         
         return None
 
     def clear_logs(self):
         """Clear all log text widgets"""
-        if hasattr(self, 'log_text') and self.log_text:
-            self.log_text.delete(1.0, tk.END)
-        if hasattr(self, 'log_text_mapping') and self.log_text_mapping:
+        self._log_buffer.clear()
+        # Clears both tabs: log_text is a peer of log_text_mapping
+        if self.log_text_mapping is not None:
             self.log_text_mapping.delete(1.0, tk.END)
 
     def bypass_dependencies(self):
@@ -2324,8 +3033,10 @@ class ExcelComparisonTool:
     def check_for_updates(self):
         """Check for new releases on GitHub"""
         try:
-            # Import packaging.version for version comparison
-            from packaging import version as packaging_version
+            # Version comparison uses the module-level packaging.version import
+            if not HAS_PACKAGING:
+                self.log_message("Update check skipped: packaging is not installed", LOG_LEVELS["DEBUG"])
+                return
             
             # Current version (should match the version in excella_setup.iss).
             current_version = APP_VERSION  # Update this when you release new versions
@@ -2514,15 +3225,16 @@ def main():
     app.log_message(APP_COPYRIGHT, LOG_LEVELS["INFO"])
     
     # Display system info for debugging
-    is_frozen = getattr(sys, 'frozen', False)
+    is_frozen = _FROZEN
     
     # When running as executable, force pandas version display
     if is_frozen:
-        pandas_version = pd.__version__
+        pandas_version = _pd().__version__
         app.log_message("Running as packaged executable", LOG_LEVELS["INFO"])
     elif HAS_PANDAS:
         try:
-            pandas_version = pd.__version__
+            # Read from metadata so startup does not pay for importing pandas
+            pandas_version = importlib_metadata.version("pandas")
         except:
             pandas_version = "Unknown version"
     else:
@@ -2550,5 +3262,7 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # Lets frozen builds start fuzzy-matching pool workers (see _prefill_match_cache)
+    multiprocessing.freeze_support()
     main()
 